@@ -9,10 +9,14 @@ from enum import Enum
 from typing import Any, Callable, Optional
 
 from cc_status.engine.scheduler import Scheduler
-from cc_status.modules.base import BaseModule, ModuleOutput
+from cc_status.modules.base import BaseModule, ModuleOutput, ModuleStatus
+from cc_status.modules.context import ParsedContext
 from cc_status.modules.registry import ModuleRegistry
 from cc_status.theme.loader import ThemeLoader
 
+# 不可用模块共享的禁用输出，跳过 get_output 时仍按原有约定记录禁用状态
+_DISABLED_OUTPUT = ModuleOutput(text="", icon="", color="", status=ModuleStatus.DISABLED)
+
 
 class DisplayMode(Enum):
     """显示模式枚举。"""
@@ -58,6 +62,7 @@ class StatuslineEngine:
         }
         self._current_theme: Optional[dict[str, Any]] = None
         self._context: dict[str, Any] = {}  # Claude Code 传递的上下文数据
+        self._parsed_context = ParsedContext()  # 每次设置上下文时解析一次
 
     @property
     def config(self) -> EngineConfig:
@@ -99,13 +104,24 @@ class StatuslineEngine:
             context: 包含 cost.total_duration_ms 等字段的字典
         """
         self._context = context
-        # 将上下文传递给所有模块
+        self._parsed_context = ParsedContext.from_raw(context)
+        # 将解析后的上下文传递给所有模块
         for module in self._modules:
-            if hasattr(module, "set_context"):
-                try:
-                    module.set_context(context)
-                except Exception:
-                    pass
+            self._apply_context(module)
+
+    def _apply_context(self, module: BaseModule) -> None:
+        """将共享的上下文快照传递给模块。
+
+        Args:
+            module: 模块实例
+        """
+        try:
+            if hasattr(module, "set_parsed_context"):
+                module.set_parsed_context(self._parsed_context)
+            elif hasattr(module, "set_context"):
+                module.set_context(self._context)
+        except Exception:
+            pass
 
     def load_theme(self, name: Optional[str] = None) -> dict[str, Any]:
         """加载主题。
@@ -150,6 +166,9 @@ class StatuslineEngine:
         # 加载主题
         self.load_theme()
 
+        # 注册导入时登记的内置模块
+        ModuleRegistry.bulk_register_pending()
+
         # 获取启用的模块
         if self._config.modules:
             for name in self._config.modules:
@@ -158,11 +177,8 @@ class StatuslineEngine:
                         module = ModuleRegistry.get_instance(name)
                         # 如果有上下文数据，先传递给模块
                         # 这样依赖上下文的模块才能正确报告可用性
-                        if self._context and hasattr(module, "set_context"):
-                            try:
-                                module.set_context(self._context)
-                            except Exception:
-                                pass
+                        if self._context:
+                            self._apply_context(module)
                         if module.is_available():
                             self._modules.append(module)
                     except Exception:
@@ -194,9 +210,14 @@ class StatuslineEngine:
         def refresh() -> None:
             try:
                 module.refresh()
-                output = module.get_output()
                 with self._lock:
-                    self._outputs[module.metadata.name] = output
+                    # 不可用模块跳过 get_output，直接记录共享的禁用输出
+                    if module:
+                        self._outputs[module.metadata.name] = module.get_output()
+                    else:
+                        self._outputs[module.metadata.name] = _DISABLED_OUTPUT
+                # 模块可能根据数据变化动态调整刷新间隔
+                self._scheduler.update_interval(module.metadata.name, module.get_refresh_interval())
                 self._notify_output_update()
             except Exception as e:
                 self._notify_error(str(e))
@@ -215,8 +236,10 @@ class StatuslineEngine:
         for module in self._modules:
             try:
                 module.refresh()
-                output = module.get_output()
-                self._outputs[module.metadata.name] = output
+                if module:
+                    self._outputs[module.metadata.name] = module.get_output()
+                else:
+                    self._outputs[module.metadata.name] = _DISABLED_OUTPUT
             except Exception:
                 pass
 
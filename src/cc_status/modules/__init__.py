@@ -12,12 +12,14 @@ from cc_status.modules.base import (
     ModuleOutput,
     ModuleStatus,
 )
+from cc_status.modules.context import ParsedContext
 from cc_status.modules.registry import ModuleRegistry, registry
 
 __all__ = [
     "ModuleStatus",
     "ModuleOutput",
     "ModuleMetadata",
+    "ParsedContext",
     "BaseModule",
     "ModuleError",
     "ModuleNotFoundError",
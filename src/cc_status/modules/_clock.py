@@ -0,0 +1,43 @@
+"""共享时钟缓存。
+
+同一渲染周期内多个时间模块共用一次 datetime.now() 结果，减少系统调用。
+"""
+
+import time
+from datetime import datetime
+from typing import Optional
+
+_last_mono: float = 0.0
+_last_now: Optional[datetime] = None
+
+
+# 获取单调时钟读数的辅助函数，测试可单独替换而不影响全局 time.monotonic
+def _monotonic() -> float:
+    """获取单调时钟读数。"""
+    return time.monotonic()
+
+
+def now_cached(ttl: float = 0.1) -> datetime:
+    """获取带缓存的当前时间。
+
+    使用单调时钟判断缓存是否过期，在 ttl 秒内重复调用返回同一时间。
+
+    Args:
+        ttl: 缓存有效期（秒）
+
+    Returns:
+        当前时间
+    """
+    global _last_mono, _last_now
+    mono = _monotonic()
+    if _last_now is None or mono - _last_mono >= ttl:
+        _last_now = datetime.now()
+        _last_mono = mono
+    return _last_now
+
+
+def reset_clock() -> None:
+    """清除时钟缓存。"""
+    global _last_mono, _last_now
+    _last_mono = 0.0
+    _last_now = None
@@ -3,9 +3,12 @@
 提供所有功能模块的基类和数据类型。
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Callable, Optional, Protocol, runtime_checkable
+
+from cc_status.modules.context import ParsedContext
 
 
 class ModuleStatus(Enum):
@@ -17,10 +20,17 @@ class ModuleStatus(Enum):
     DISABLED = "disabled"
 
 
-@dataclass
+# Python 3.10+ 支持 dataclass 的 slots 参数，旧版本退化为普通实例字典
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, eq=False, **_SLOTS)
 class ModuleOutput:
     """模块输出数据类。
 
+    不可变对象，可在模块间安全共享与缓存。相等比较与哈希基于解析后的提示信息，
+    延迟格式化的提示信息与等价的字符串提示信息视为相等。
+
     Attributes:
         text: 显示的文本内容
         icon: 显示的图标（可选）
@@ -28,6 +38,8 @@ class ModuleOutput:
         status: 模块状态（可选）
         tooltip: 悬停提示信息（可选）
         style: 自定义样式（可选）
+        tooltip_factory: 延迟生成提示信息的无参可调用对象（可选），设置后优先于 tooltip，
+            适用于跨多次刷新缓存复用的输出
     """
 
     text: str
@@ -36,6 +48,7 @@ class ModuleOutput:
     status: ModuleStatus = ModuleStatus.SUCCESS
     tooltip: str = ""
     style: str = ""
+    tooltip_factory: Optional[Callable[[], str]] = field(default=None, repr=False)
 
     def __str__(self) -> str:
         """返回格式化后的输出。"""
@@ -45,6 +58,32 @@ class ModuleOutput:
         parts.append(self.text)
         return " ".join(parts)
 
+    def get_tooltip(self) -> str:
+        """获取提示信息文本。
+
+        设置了 tooltip_factory 时在此处按需格式化，否则返回 tooltip。
+
+        Returns:
+            提示信息文本
+        """
+        if self.tooltip_factory is not None:
+            return self.tooltip_factory()
+        return self.tooltip
+
+    def _compare_key(self) -> tuple[Any, ...]:
+        """获取用于相等比较与哈希的字段元组。"""
+        return (self.text, self.icon, self.color, self.status, self.get_tooltip(), self.style)
+
+    def __eq__(self, other: object) -> bool:
+        """按字段值比较，提示信息以格式化后的文本参与比较。"""
+        if not isinstance(other, ModuleOutput):
+            return NotImplemented
+        return self._compare_key() == other._compare_key()
+
+    def __hash__(self) -> int:
+        """与 __eq__ 一致的哈希值。"""
+        return hash(self._compare_key())
+
     def to_dict(self) -> dict:
         """转换为字典格式。"""
         return {
@@ -52,7 +91,7 @@ class ModuleOutput:
             "icon": self.icon,
             "color": self.color,
             "status": self.status.value,
-            "tooltip": self.tooltip,
+            "tooltip": self.get_tooltip(),
             "style": self.style,
         }
 
@@ -126,6 +165,14 @@ class BaseModule(Protocol):
         """
         return True
 
+    def __bool__(self) -> bool:
+        """模块可用时为真，渲染循环可据此跳过不可用模块。
+
+        Returns:
+            bool: 模块是否可用
+        """
+        return self.is_available()
+
     def get_refresh_interval(self) -> float:
         """获取刷新间隔（秒）。
 
@@ -144,6 +191,17 @@ class BaseModule(Protocol):
         """
         pass
 
+    def set_parsed_context(self, parsed: ParsedContext) -> None:
+        """设置预解析的上下文快照。
+
+        引擎每次渲染只解析一次上下文，再分发给所有模块。
+        默认回退到 set_context，模块可覆盖以直接读取已解析字段。
+
+        Args:
+            parsed: 解析后的上下文
+        """
+        self.set_context(parsed.raw)
+
 
 class ModuleError(Exception):
     """模块相关错误。"""
@@ -328,7 +328,6 @@ class VersionModule(BaseModule):
 
     def __init__(self) -> None:
         self._version: str = ""
-        self._context: dict[str, Any] = {}
 
     @property
     def metadata(self) -> ModuleMetadata:
@@ -346,7 +345,6 @@ class VersionModule(BaseModule):
 
     def set_context(self, context: dict[str, Any]) -> None:
         """设置上下文数据。"""
-        self._context = context
         self._version = context.get("version", "")
 
     def refresh(self) -> None:
@@ -385,21 +383,12 @@ class VersionModule(BaseModule):
         pass
 
 
-# 自动注册模块
-def _register_modules() -> None:
-    """注册所有基础模块。"""
-    modules = [
+# 延迟注册：导入时仅登记，首次查询注册表时再注册并启用
+ModuleRegistry.register_deferred(
+    [
         ("dir", DirectoryModule),
         ("git_branch", GitBranchModule),
         ("git_status", GitStatusModule),
         ("version", VersionModule),
     ]
-
-    for name, module_class in modules:
-        if not ModuleRegistry.has_module(name):
-            ModuleRegistry.register(name, module_class)
-            ModuleRegistry.enable(name)
-
-
-# 自动注册
-_register_modules()
+)
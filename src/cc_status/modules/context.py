@@ -0,0 +1,210 @@
+"""上下文解析。
+
+将 Claude Code statusLine hook 传入的原始 JSON 一次性解析为结构化快照，
+供各模块共享，避免每个模块重复遍历同一字典。
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Optional
+
+from cc_status.modules._clock import now_cached
+
+# 次日午夜缓存 (日期, 次日午夜)，每天只需计算一次
+_MIDNIGHT_CACHE: Optional[tuple[date, datetime]] = None
+
+# 模型系列关键字及显示名称，按原有优先级依次匹配（系列名优先于通用的 "claude" 前缀）
+_MODEL_FAMILIES = (
+    (re.compile("sonnet", re.IGNORECASE), "Sonnet"),
+    (re.compile("opus", re.IGNORECASE), "Opus"),
+    (re.compile("haiku", re.IGNORECASE), "Haiku"),
+)
+_CLAUDE_RE = re.compile("claude", re.IGNORECASE)
+
+# 字段格式异常时可能抛出的错误，解析时捕获并回退到默认值
+_FIELD_ERRORS = (TypeError, ValueError, AttributeError, OverflowError)
+
+
+@lru_cache(maxsize=64)
+def _classify_model(model: str) -> str:
+    """将原始模型字符串简化为显示名称。
+
+    模型字符串在会话内几乎不变，使用 LRU 缓存避免每次刷新重复扫描。
+
+    Args:
+        model: 原始模型名称或 ID
+
+    Returns:
+        简化后的模型名称
+    """
+    # 不区分大小写的预编译正则逐个匹配，避免生成小写副本
+    for pattern, family in _MODEL_FAMILIES:
+        if pattern.search(model):
+            return family
+    if _CLAUDE_RE.search(model):
+        # 提取版本号
+        parts = model.split()
+        for part in parts:
+            if part[0].isdigit():
+                return f"Claude {part}"
+        return "Claude"
+    return model
+
+
+def _next_midnight(now: datetime) -> datetime:
+    """获取下一个午夜时间（按日期缓存）。
+
+    Args:
+        now: 当前时间
+
+    Returns:
+        次日零点
+    """
+    global _MIDNIGHT_CACHE
+    today = now.date()
+    if _MIDNIGHT_CACHE is None or _MIDNIGHT_CACHE[0] != today:
+        next_midnight = datetime(today.year, today.month, today.day) + timedelta(days=1)
+        _MIDNIGHT_CACHE = (today, next_midnight)
+    return _MIDNIGHT_CACHE[1]
+
+
+@lru_cache(maxsize=16)
+def _from_timestamp(timestamp: float) -> datetime:
+    """将 Unix 时间戳转换为本地时间（带缓存）。
+
+    Args:
+        timestamp: Unix 时间戳（秒）
+
+    Returns:
+        对应的本地时间
+    """
+    return datetime.fromtimestamp(timestamp)
+
+
+def parse_model_name(context: dict[str, Any]) -> str:
+    """从上下文中提取模型名称。
+
+    Args:
+        context: 上下文数据
+
+    Returns:
+        模型名称，字段缺失或格式异常时返回空字符串
+    """
+    try:
+        model_data = context.get("model", "")
+        if not model_data:
+            return ""
+
+        # 处理对象格式: {"id": "...", "display_name": "Opus"}
+        if isinstance(model_data, dict):
+            # 优先使用 display_name
+            model = model_data.get("display_name", "")
+            if not model:
+                model = model_data.get("id", "")
+        else:
+            # 处理字符串格式（向后兼容）
+            model = str(model_data)
+
+        if not model:
+            return ""
+
+        return _classify_model(str(model))
+    except _FIELD_ERRORS:
+        return ""
+
+
+def parse_percentage(context: dict[str, Any]) -> int:
+    """计算上下文使用百分比。
+
+    Args:
+        context: 上下文数据
+
+    Returns:
+        使用百分比 (0-100)，字段缺失或格式异常时返回 0
+    """
+    try:
+        # 优先从 context_window 对象获取（Claude Code 传递的格式）
+        context_window = context.get("context_window", {})
+        if isinstance(context_window, dict):
+            used_pct = context_window.get("used_percentage")
+            if used_pct is not None:
+                return int(float(used_pct))
+
+        # 尝试从 cost 数据中获取
+        cost_data = context.get("cost", {})
+        if "context_percentage" in cost_data:
+            return int(cost_data["context_percentage"])
+
+        # 或者从 tokens 计算
+        tokens_data = context.get("tokens", {})
+        used = tokens_data.get("used", 0)
+        limit = tokens_data.get("limit", 0)
+        if limit > 0:
+            return int((used / limit) * 100)
+    except _FIELD_ERRORS:
+        pass
+
+    return 0
+
+
+def parse_reset_time(context: dict[str, Any]) -> Optional[datetime]:
+    """从上下文中提取重置时间。
+
+    Args:
+        context: 上下文数据
+
+    Returns:
+        重置时间，字段缺失或格式异常时返回次日午夜
+    """
+    # 尝试从 cost 数据中获取
+    try:
+        reset_timestamp = context.get("cost", {}).get("next_reset_time")
+    except AttributeError:
+        reset_timestamp = None
+    if reset_timestamp:
+        try:
+            # 假设是 Unix 时间戳（秒）
+            return _from_timestamp(reset_timestamp)
+        except (ValueError, TypeError, OverflowError, OSError):
+            pass
+
+    # 如果没有提供，假设是当天午夜
+    return _next_midnight(now_cached())
+
+
+@dataclass
+class ParsedContext:
+    """解析后的上下文快照。
+
+    每次渲染只构建一次，由引擎分发给所有模块。
+
+    Attributes:
+        raw: 原始上下文字典
+        percentage: 上下文使用百分比
+        reset_time: 下次重置时间
+        model: 简化后的模型名称
+    """
+
+    raw: dict[str, Any] = field(default_factory=dict)
+    percentage: int = 0
+    reset_time: Optional[datetime] = None
+    model: str = ""
+
+    @classmethod
+    def from_raw(cls, context: dict[str, Any]) -> "ParsedContext":
+        """从原始上下文构建快照。
+
+        Args:
+            context: Claude Code 传递的原始上下文
+
+        Returns:
+            解析后的上下文
+        """
+        return cls(
+            raw=context,
+            percentage=parse_percentage(context),
+            reset_time=parse_reset_time(context),
+            model=parse_model_name(context),
+        )
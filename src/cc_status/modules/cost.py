@@ -23,7 +23,6 @@ class CostSessionModule(BaseModule):
     def __init__(self) -> None:
         self._cost: float = 0.0
         self._currency: str = "$"
-        self._context: dict[str, Any] = {}
         self._decimal_places: int = 2
 
     @property
@@ -42,7 +41,6 @@ class CostSessionModule(BaseModule):
 
     def set_context(self, context: dict[str, Any]) -> None:
         """设置上下文数据。"""
-        self._context = context
         self._cost = self._extract_cost(context)
 
     def _extract_cost(self, context: dict[str, Any]) -> float:
@@ -66,7 +64,7 @@ class CostSessionModule(BaseModule):
 
     def refresh(self) -> None:
         """刷新成本信息。"""
-        self._cost = self._extract_cost(self._context)
+        pass  # 成本在 set_context 时提取，不需要刷新
 
     def _format_cost(self, cost: float) -> str:
         """格式化成本金额。
@@ -121,8 +119,8 @@ class CostTodayModule(BaseModule):
     def __init__(self) -> None:
         self._session_cost: float = 0.0
         self._today_cost: float = 0.0
+        self._available: bool = False  # set_context 时缓存的可用性
         self._currency: str = "$"
-        self._context: dict[str, Any] = {}
         self._decimal_places: int = 2
 
     @property
@@ -141,12 +139,12 @@ class CostTodayModule(BaseModule):
 
     def set_context(self, context: dict[str, Any]) -> None:
         """设置上下文数据。"""
-        self._context = context
         self._session_cost = self._extract_cost(context)
         # 今日成本 = 会话成本 + 历史今日成本（如果有）
         cost_data = context.get("cost", {})
         daily_cost = cost_data.get("daily_cost", 0.0)
         self._today_cost = daily_cost if daily_cost > 0 else self._session_cost
+        self._available = (self._today_cost > 0) or (self._session_cost > 0)
 
     def _extract_cost(self, context: dict[str, Any]) -> float:
         """从上下文中提取成本。"""
@@ -162,7 +160,7 @@ class CostTodayModule(BaseModule):
 
     def refresh(self) -> None:
         """刷新成本信息。"""
-        self._session_cost = self._extract_cost(self._context)
+        pass  # 成本在 set_context 时提取，不需要刷新
 
     def _format_cost(self, cost: float) -> str:
         """格式化成本金额。"""
@@ -191,7 +189,7 @@ class CostTodayModule(BaseModule):
 
     def is_available(self) -> bool:
         """检查模块是否可用。"""
-        return (self._today_cost > 0) or (self._session_cost > 0)
+        return self._available
 
     def get_refresh_interval(self) -> float:
         """获取刷新间隔。"""
@@ -211,8 +209,9 @@ class BurnRateModule(BaseModule):
     def __init__(self) -> None:
         self._session_cost: float = 0.0
         self._session_duration_ms: int = 0
+        self._rate: float = 0.0  # set_context 时计算的燃烧率
+        self._available: bool = False  # set_context 时缓存的可用性
         self._currency: str = "$"
-        self._context: dict[str, Any] = {}
         self._decimal_places: int = 2
 
     @property
@@ -231,11 +230,12 @@ class BurnRateModule(BaseModule):
 
     def set_context(self, context: dict[str, Any]) -> None:
         """设置上下文数据。"""
-        self._context = context
         cost_data = context.get("cost", {})
         # 优先使用 total_cost_usd（Claude Code 传递的格式）
         self._session_cost = cost_data.get("total_cost_usd", cost_data.get("total_cost", 0.0))
         self._session_duration_ms = cost_data.get("total_duration_ms", 0)
+        self._rate = self._calculate_burn_rate()
+        self._available = self._rate > 0
 
     def _calculate_burn_rate(self) -> float:
         """计算燃烧率（$/小时）。
@@ -255,9 +255,7 @@ class BurnRateModule(BaseModule):
 
     def refresh(self) -> None:
         """刷新燃烧率。"""
-        cost_data = self._context.get("cost", {})
-        self._session_cost = cost_data.get("total_cost_usd", cost_data.get("total_cost", 0.0))
-        self._session_duration_ms = cost_data.get("total_duration_ms", 0)
+        pass  # 成本与时长在 set_context 时提取，不需要刷新
 
     def _format_rate(self, rate: float) -> str:
         """格式化燃烧率。"""
@@ -265,8 +263,7 @@ class BurnRateModule(BaseModule):
 
     def get_output(self) -> ModuleOutput:
         """获取模块输出。"""
-        rate = self._calculate_burn_rate()
-        if rate <= 0:
+        if not self._available:
             return ModuleOutput(
                 text="",
                 icon="",
@@ -274,6 +271,7 @@ class BurnRateModule(BaseModule):
                 status=ModuleStatus.DISABLED,
             )
 
+        rate = self._rate
         formatted = self._format_rate(rate)
 
         # 根据燃烧率选择颜色
@@ -294,7 +292,7 @@ class BurnRateModule(BaseModule):
 
     def is_available(self) -> bool:
         """检查模块是否可用。"""
-        return self._calculate_burn_rate() > 0
+        return self._available
 
     def get_refresh_interval(self) -> float:
         """获取刷新间隔。"""
@@ -305,20 +303,11 @@ class BurnRateModule(BaseModule):
         pass
 
 
-# 自动注册模块
-def _register_modules() -> None:
-    """注册所有成本相关模块。"""
-    modules = [
+# 延迟注册：导入时仅登记，首次查询注册表时再注册并启用
+ModuleRegistry.register_deferred(
+    [
         ("cost_session", CostSessionModule),
         ("cost_today", CostTodayModule),
         ("burn_rate", BurnRateModule),
     ]
-
-    for name, module_class in modules:
-        if not ModuleRegistry.has_module(name):
-            ModuleRegistry.register(name, module_class)
-            ModuleRegistry.enable(name)
-
-
-# 自动注册
-_register_modules()
+)
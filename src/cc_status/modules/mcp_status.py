@@ -144,7 +144,7 @@ class MCPStatusModule(BaseModule):
             )
 
             if result.returncode == 0:
-                servers.extend(self._parse_mcp_list_output(result.stdout))
+                servers.extend(self._parse_command_output(result.stdout))
         except subprocess.TimeoutExpired:
             # 命令超时，返回空列表（将在下次重试）
             pass
@@ -153,17 +153,20 @@ class MCPStatusModule(BaseModule):
 
         return servers
 
-    def _parse_mcp_list_output(self, output: str) -> list[MCPServerInfo]:
+    @staticmethod
+    def _parse_command_output(stdout: str) -> list[MCPServerInfo]:
         """解析 claude mcp list 命令输出。
 
+        纯函数，不依赖实例状态，可直接用字符串测试。
+
         Args:
-            output: 命令输出
+            stdout: 命令输出
 
         Returns:
             MCP 服务器列表
         """
         servers: list[MCPServerInfo] = []
-        lines = output.strip().split("\n")
+        lines = stdout.strip().split("\n")
 
         for line in lines:
             line = line.strip()
@@ -218,7 +221,7 @@ class MCPStatusModule(BaseModule):
         # 配置文件路径
         config_path = Path.home() / ".claude.json"
 
-        if not config_path.exists():
+        if not _path_exists(config_path):
             self._config_cache = servers
             self._config_cache_time = now
             return servers
@@ -463,15 +466,11 @@ def _get_current_time() -> float:
     return time.time()
 
 
-# 注册模块
-def _register_module() -> None:
-    """注册模块到注册表。"""
-    ModuleRegistry.register(
-        "mcp_status",
-        MCPStatusModule,
-    )
-    ModuleRegistry.enable("mcp_status")
+# 检查路径是否存在的辅助函数
+def _path_exists(path: Path) -> bool:
+    """检查路径是否存在。"""
+    return os.path.exists(path)
 
 
-# 自动注册
-_register_module()
+# 延迟注册：导入时仅登记，首次查询注册表时再注册并启用
+ModuleRegistry.register_deferred([("mcp_status", MCPStatusModule)])
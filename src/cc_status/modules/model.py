@@ -3,7 +3,9 @@
 提供模型信息、订阅计划和上下文使用率显示。
 """
 
-from typing import Any
+from bisect import bisect_right
+from functools import partial
+from typing import Any, Callable, Optional
 
 from cc_status.modules.base import (
     BaseModule,
@@ -11,8 +13,29 @@ from cc_status.modules.base import (
     ModuleOutput,
     ModuleStatus,
 )
+from cc_status.modules.context import ParsedContext, parse_model_name, parse_percentage
 from cc_status.modules.registry import ModuleRegistry
 
+# 预绑定状态常量，避免热路径上重复的枚举属性查找
+_SUCCESS = ModuleStatus.SUCCESS
+_WARNING = ModuleStatus.WARNING
+_ERROR = ModuleStatus.ERROR
+_DISABLED = ModuleStatus.DISABLED
+
+# 共享的禁用输出，无数据时直接返回，避免重复构造
+_DISABLED_OUTPUT = ModuleOutput(text="", icon="", color="", status=_DISABLED)
+
+# 使用率阈值（警告 70%，严重 90%）及对应的 (颜色, 状态)
+_PCT_THRESHOLDS = (70, 90)
+_PCT_STYLES = (("green", _SUCCESS), ("yellow", _WARNING), ("red", _ERROR))
+
+# 默认宽度进度条的预计算表，百分比 0-100 直接索引
+_BAR_WIDTH = 10
+_BAR_CACHE_10 = tuple(
+    f"[{'█' * int(p / 100 * _BAR_WIDTH)}{'░' * (_BAR_WIDTH - int(p / 100 * _BAR_WIDTH))}] {p}%"
+    for p in range(101)
+)
+
 
 class ModelModule(BaseModule):
     """模型信息模块。
@@ -22,7 +45,8 @@ class ModelModule(BaseModule):
 
     def __init__(self) -> None:
         self._model: str = ""
-        self._context: dict[str, Any] = {}
+        self._cached_key: Any = None
+        self._cached_output: Optional[ModuleOutput] = None
 
     @property
     def metadata(self) -> ModuleMetadata:
@@ -40,8 +64,21 @@ class ModelModule(BaseModule):
 
     def set_context(self, context: dict[str, Any]) -> None:
         """设置上下文数据。"""
-        self._context = context
-        self._model = self._extract_model_name(context)
+        self._update_model(self._extract_model_name(context))
+
+    def set_parsed_context(self, parsed: ParsedContext) -> None:
+        """设置预解析的上下文快照。"""
+        self._update_model(parsed.model)
+
+    def _update_model(self, model: str) -> None:
+        """更新模型名称，仅在变化时使输出缓存失效。
+
+        Args:
+            model: 新的模型名称
+        """
+        if model != self._model:
+            self._model = model
+            self._cached_output = None
 
     def _extract_model_name(self, context: dict[str, Any]) -> str:
         """从上下文中提取模型名称。
@@ -52,39 +89,7 @@ class ModelModule(BaseModule):
         Returns:
             模型名称
         """
-        model_data = context.get("model", "")
-        if not model_data:
-            return ""
-
-        # 处理对象格式: {"id": "...", "display_name": "Opus"}
-        if isinstance(model_data, dict):
-            # 优先使用 display_name
-            model = model_data.get("display_name", "")
-            if not model:
-                model = model_data.get("id", "")
-        else:
-            # 处理字符串格式（向后兼容）
-            model = str(model_data)
-
-        if not model:
-            return ""
-
-        # 简化模型名称
-        model_lower = model.lower()
-        if "sonnet" in model_lower:
-            return "Sonnet"
-        elif "opus" in model_lower:
-            return "Opus"
-        elif "haiku" in model_lower:
-            return "Haiku"
-        elif "claude" in model_lower:
-            # 提取版本号
-            parts = model.split()
-            for part in parts:
-                if part[0].isdigit():
-                    return f"Claude {part}"
-            return "Claude"
-        return model
+        return parse_model_name(context)
 
     def refresh(self) -> None:
         """刷新模型信息。"""
@@ -93,20 +98,23 @@ class ModelModule(BaseModule):
     def get_output(self) -> ModuleOutput:
         """获取模块输出。"""
         if not self._model:
-            return ModuleOutput(
-                text="",
-                icon="",
-                color="",
-                status=ModuleStatus.DISABLED,
-            )
-
-        return ModuleOutput(
+            return _DISABLED_OUTPUT
+
+        key = self._model
+        if self._cached_output is not None and key == self._cached_key:
+            return self._cached_output
+
+        output = ModuleOutput(
             text=self._model,
             icon="🤖",
             color="purple",
-            status=ModuleStatus.SUCCESS,
-            tooltip=f"当前模型: {self._model}",
+            status=_SUCCESS,
+            # 输出按模型缓存复用，提示信息仅在读取时格式化
+            tooltip_factory=partial("当前模型: {}".format, self._model),
         )
+        self._cached_key = key
+        self._cached_output = output
+        return output
 
     def is_available(self) -> bool:
         """检查模块是否可用。"""
@@ -121,36 +129,76 @@ class ModelModule(BaseModule):
         pass
 
 
-class ContextPercentModule(BaseModule):
-    """上下文使用率百分比模块。
+class _StableBackoff:
+    """刷新间隔退避。
 
-    显示上下文使用百分比。
+    被跟踪的数值连续未变化时按指数退避刷新间隔：5s → 10s → 20s → 40s，上限 60s。
     """
 
-    def __init__(self) -> None:
-        self._percentage: int = 0
-        self._context: dict[str, Any] = {}
-        self._warning_threshold: int = 70
-        self._critical_threshold: int = 90
+    _stable_ticks: int = 0
+    _last_value: int = -1
 
-    @property
-    def metadata(self) -> ModuleMetadata:
-        return ModuleMetadata(
-            name="context_pct",
-            description="显示上下文使用百分比",
-            version="1.0.0",
-            author="Claude Code",
-            enabled=True,
-        )
+    def _track_stability(self, value: int) -> None:
+        """记录一次刷新后的数值。
+
+        Args:
+            value: 本次刷新后的数值
+        """
+        if value == self._last_value:
+            self._stable_ticks += 1
+        else:
+            self._stable_ticks = 0
+            self._last_value = value
+
+    def _reset_backoff(self) -> None:
+        """数值变化时立即恢复最短刷新间隔。"""
+        self._stable_ticks = 0
+
+    def _backoff_interval(self) -> float:
+        """获取退避后的刷新间隔。"""
+        return min(5.0 * (1 << min(self._stable_ticks, 4)), 60.0)
+
+
+class _ContextUsageModule(_StableBackoff, BaseModule):
+    """上下文使用率模块基类。
+
+    负责百分比的延迟计算与输出缓存，刷新间隔退避由 _StableBackoff 提供，
+    子类只需提供元数据并传入显示文本的格式化函数。
+    """
+
+    def __init__(self, render_text: Callable[[int], str]) -> None:
+        self._render_text = render_text
+        self._percentage: int = 0
+        self._dirty: bool = False
+        self._pending_context: Optional[dict[str, Any]] = None  # 待计算的上下文
+        self._cached_key: Any = None
+        self._cached_output: Optional[ModuleOutput] = None
 
     def initialize(self) -> None:
         """初始化模块。"""
         pass
 
     def set_context(self, context: dict[str, Any]) -> None:
-        """设置上下文数据。"""
-        self._context = context
-        self._percentage = self._calculate_percentage(context)
+        """设置上下文数据。
+
+        仅暂存上下文并标记为脏，百分比在首次读取时计算一次，计算后即释放引用。
+        """
+        self._pending_context = context
+        self._dirty = True
+
+    def set_parsed_context(self, parsed: ParsedContext) -> None:
+        """设置预解析的上下文快照。"""
+        self._dirty = False
+        self._pending_context = None
+        self._update_percentage(parsed.percentage)
+
+    def _sync(self) -> None:
+        """上下文重新绑定后按需重新计算百分比。"""
+        if self._dirty:
+            self._dirty = False
+            context, self._pending_context = self._pending_context, None
+            if context is not None:
+                self._update_percentage(self._calculate_percentage(context))
 
     def _calculate_percentage(self, context: dict[str, Any]) -> int:
         """计算上下文使用百分比。
@@ -161,85 +209,96 @@ class ContextPercentModule(BaseModule):
         Returns:
             使用百分比 (0-100)
         """
-        # 优先从 context_window 对象获取（Claude Code 传递的格式）
-        context_window = context.get("context_window", {})
-        if isinstance(context_window, dict):
-            used_pct = context_window.get("used_percentage")
-            if used_pct is not None:
-                return int(float(used_pct))
-
-        # 尝试从 cost 数据中获取
-        cost_data = context.get("cost", {})
-        if "context_percentage" in cost_data:
-            return int(cost_data["context_percentage"])
-
-        # 或者从 tokens 计算
-        tokens_data = context.get("tokens", {})
-        used = tokens_data.get("used", 0)
-        limit = tokens_data.get("limit", 0)
-        if limit > 0:
-            return int((used / limit) * 100)
-
-        return 0
+        return parse_percentage(context)
+
+    def _update_percentage(self, percentage: int) -> None:
+        """更新百分比，仅在数值变化时使输出缓存失效。
+
+        Args:
+            percentage: 新的使用百分比
+        """
+        if percentage != self._percentage:
+            self._percentage = percentage
+            self._cached_output = None
+            self._reset_backoff()
 
     def refresh(self) -> None:
         """刷新上下文使用率。"""
-        self._percentage = self._calculate_percentage(self._context)
+        self._sync()
+        self._track_stability(self._percentage)
 
     def get_output(self) -> ModuleOutput:
         """获取模块输出。"""
+        self._sync()
         if self._percentage == 0:
-            return ModuleOutput(
-                text="",
-                icon="",
-                color="",
-                status=ModuleStatus.DISABLED,
-            )
+            return _DISABLED_OUTPUT
+
+        key = self._percentage
+        if self._cached_output is not None and key == self._cached_key:
+            return self._cached_output
 
         # 根据使用率选择颜色
-        if self._percentage >= self._critical_threshold:
-            color = "red"
-            status = ModuleStatus.ERROR
-        elif self._percentage >= self._warning_threshold:
-            color = "yellow"
-            status = ModuleStatus.WARNING
-        else:
-            color = "green"
-            status = ModuleStatus.SUCCESS
+        color, status = _PCT_STYLES[bisect_right(_PCT_THRESHOLDS, self._percentage)]
 
-        return ModuleOutput(
-            text=f"{self._percentage}%",
+        output = ModuleOutput(
+            text=self._render_text(self._percentage),
             icon="🧠",
             color=color,
             status=status,
-            tooltip=f"上下文使用: {self._percentage}%",
+            # 输出按百分比缓存复用，提示信息仅在读取时格式化
+            tooltip_factory=partial("上下文使用: {}%".format, self._percentage),
         )
+        self._cached_key = key
+        self._cached_output = output
+        return output
 
     def is_available(self) -> bool:
         """检查模块是否可用。"""
+        self._sync()
         return self._percentage > 0
 
     def get_refresh_interval(self) -> float:
-        """获取刷新间隔。"""
-        return 5.0  # 5秒刷新一次
+        """获取刷新间隔。
+
+        百分比连续未变化时按指数退避。
+        """
+        self._sync()
+        return self._backoff_interval()
 
     def cleanup(self) -> None:
         """清理资源。"""
         pass
 
 
-class ContextBarModule(BaseModule):
+class ContextPercentModule(_ContextUsageModule):
+    """上下文使用率百分比模块。
+
+    显示上下文使用百分比。
+    """
+
+    def __init__(self) -> None:
+        super().__init__("{}%".format)
+
+    @property
+    def metadata(self) -> ModuleMetadata:
+        return ModuleMetadata(
+            name="context_pct",
+            description="显示上下文使用百分比",
+            version="1.0.0",
+            author="Claude Code",
+            enabled=True,
+        )
+
+
+class ContextBarModule(_ContextUsageModule):
     """上下文进度条模块。
 
     使用进度条显示上下文使用率。
     """
 
     def __init__(self) -> None:
-        self._percentage: int = 0
-        self._context: dict[str, Any] = {}
-        self._bar_width: int = 10
-        self._warning_threshold: int = 70
-        self._critical_threshold: int = 90
+        super().__init__(self._render_bar)
+        self._bar_width: int = _BAR_WIDTH
 
     @property
     def metadata(self) -> ModuleMetadata:
@@ -251,37 +310,6 @@ class ContextBarModule(BaseModule):
             enabled=True,
         )
 
-    def initialize(self) -> None:
-        """初始化模块。"""
-        pass
-
-    def set_context(self, context: dict[str, Any]) -> None:
-        """设置上下文数据。"""
-        self._context = context
-        self._percentage = self._calculate_percentage(context)
-
-    def _calculate_percentage(self, context: dict[str, Any]) -> int:
-        """计算上下文使用百分比。"""
-        # 优先从 context_window 对象获取（Claude Code 传递的格式）
-        context_window = context.get("context_window", {})
-        if isinstance(context_window, dict):
-            used_pct = context_window.get("used_percentage")
-            if used_pct is not None:
-                return int(float(used_pct))
-
-        # 尝试从 cost 数据中获取
-        cost_data = context.get("cost", {})
-        if "context_percentage" in cost_data:
-            return int(cost_data["context_percentage"])
-
-        tokens_data = context.get("tokens", {})
-        used = tokens_data.get("used", 0)
-        limit = tokens_data.get("limit", 0)
-        if limit > 0:
-            return int((used / limit) * 100)
-
-        return 0
-
     def _render_bar(self, percentage: int) -> str:
         """渲染进度条。
 
@@ -291,6 +319,9 @@ class ContextBarModule(BaseModule):
         Returns:
             进度条字符串
         """
+        if self._bar_width == _BAR_WIDTH and 0 <= percentage <= 100:
+            return _BAR_CACHE_10[percentage]
+
         filled = int((percentage / 100) * self._bar_width)
         empty = self._bar_width - filled
 
@@ -298,68 +329,12 @@ class ContextBarModule(BaseModule):
         bar = "█" * filled + "░" * empty
         return f"[{bar}] {percentage}%"
 
-    def refresh(self) -> None:
-        """刷新进度条。"""
-        self._percentage = self._calculate_percentage(self._context)
-
-    def get_output(self) -> ModuleOutput:
-        """获取模块输出。"""
-        if self._percentage == 0:
-            return ModuleOutput(
-                text="",
-                icon="",
-                color="",
-                status=ModuleStatus.DISABLED,
-            )
-
-        # 根据使用率选择颜色
-        if self._percentage >= self._critical_threshold:
-            color = "red"
-            status = ModuleStatus.ERROR
-        elif self._percentage >= self._warning_threshold:
-            color = "yellow"
-            status = ModuleStatus.WARNING
-        else:
-            color = "green"
-            status = ModuleStatus.SUCCESS
-
-        bar_text = self._render_bar(self._percentage)
-
-        return ModuleOutput(
-            text=bar_text,
-            icon="🧠",
-            color=color,
-            status=status,
-            tooltip=f"上下文使用: {self._percentage}%",
-        )
 
-    def is_available(self) -> bool:
-        """检查模块是否可用。"""
-        return self._percentage > 0
-
-    def get_refresh_interval(self) -> float:
-        """获取刷新间隔。"""
-        return 5.0
-
-    def cleanup(self) -> None:
-        """清理资源。"""
-        pass
-
-
-# 自动注册模块
-def _register_modules() -> None:
-    """注册所有模型相关模块。"""
-    modules = [
+# 延迟注册：导入时仅登记，首次查询注册表时再注册并启用
+ModuleRegistry.register_deferred(
+    [
         ("model", ModelModule),
         ("context_pct", ContextPercentModule),
         ("context_bar", ContextBarModule),
     ]
-
-    for name, module_class in modules:
-        if not ModuleRegistry.has_module(name):
-            ModuleRegistry.register(name, module_class)
-            ModuleRegistry.enable(name)
-
-
-# 自动注册
-_register_modules()
+)
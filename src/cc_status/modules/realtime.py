@@ -23,7 +23,6 @@ class AgentStatusModule(BaseModule):
     def __init__(self) -> None:
         self._active_agents: list[dict[str, Any]] = []
         self._active_tools: list[dict[str, Any]] = []
-        self._context: dict[str, Any] = {}
         self._max_items: int = 2
 
     @property
@@ -42,14 +41,12 @@ class AgentStatusModule(BaseModule):
 
     def set_context(self, context: dict[str, Any]) -> None:
         """设置上下文数据。"""
-        self._context = context
         self._active_agents = context.get("active_agents", [])
         self._active_tools = context.get("active_tools", [])
 
     def refresh(self) -> None:
         """刷新代理状态。"""
-        self._active_agents = self._context.get("active_agents", [])
-        self._active_tools = self._context.get("active_tools", [])
+        pass  # 代理与工具列表在 set_context 时提取，不需要刷新
 
     def _format_agent(self, agent: dict[str, Any]) -> str:
         """格式化代理信息。
@@ -146,7 +143,6 @@ class TodoProgressModule(BaseModule):
     def __init__(self) -> None:
         self._total: int = 0
         self._completed: int = 0
-        self._context: dict[str, Any] = {}
 
     @property
     def metadata(self) -> ModuleMetadata:
@@ -164,16 +160,13 @@ class TodoProgressModule(BaseModule):
 
     def set_context(self, context: dict[str, Any]) -> None:
         """设置上下文数据。"""
-        self._context = context
         todo_data = context.get("todo", {})
         self._total = todo_data.get("total", 0)
         self._completed = todo_data.get("completed", 0)
 
     def refresh(self) -> None:
         """刷新 TODO 进度。"""
-        todo_data = self._context.get("todo", {})
-        self._total = todo_data.get("total", 0)
-        self._completed = todo_data.get("completed", 0)
+        pass  # 进度在 set_context 时提取，不需要刷新
 
     def get_output(self) -> ModuleOutput:
         """获取模块输出。"""
@@ -226,7 +219,7 @@ class ActivityIndicatorModule(BaseModule):
     """
 
     def __init__(self) -> None:
-        self._context: dict[str, Any] = {}
+        self._available: bool = False  # set_context 时缓存的可用性（是否有活动）
         self._spinner_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         self._frame_index: int = 0
 
@@ -246,7 +239,7 @@ class ActivityIndicatorModule(BaseModule):
 
     def set_context(self, context: dict[str, Any]) -> None:
         """设置上下文数据。"""
-        self._context = context
+        self._available = bool(context.get("active_agents") or context.get("active_tools"))
 
     def refresh(self) -> None:
         """刷新指示器。"""
@@ -255,10 +248,7 @@ class ActivityIndicatorModule(BaseModule):
     def get_output(self) -> ModuleOutput:
         """获取模块输出。"""
         # 检查是否有活动
-        active_agents = self._context.get("active_agents", [])
-        active_tools = self._context.get("active_tools", [])
-
-        if not active_agents and not active_tools:
+        if not self._available:
             return ModuleOutput(
                 text="",
                 icon="",
@@ -278,9 +268,7 @@ class ActivityIndicatorModule(BaseModule):
 
     def is_available(self) -> bool:
         """检查模块是否可用。"""
-        active_agents = self._context.get("active_agents", [])
-        active_tools = self._context.get("active_tools", [])
-        return bool(active_agents or active_tools)
+        return self._available
 
     def get_refresh_interval(self) -> float:
         """获取刷新间隔。"""
@@ -291,20 +279,11 @@ class ActivityIndicatorModule(BaseModule):
         pass
 
 
-# 自动注册模块
-def _register_modules() -> None:
-    """注册所有实时监控模块。"""
-    modules = [
+# 延迟注册：导入时仅登记，首次查询注册表时再注册并启用
+ModuleRegistry.register_deferred(
+    [
         ("agent_status", AgentStatusModule),
         ("todo_progress", TodoProgressModule),
         ("activity_indicator", ActivityIndicatorModule),
     ]
-
-    for name, module_class in modules:
-        if not ModuleRegistry.has_module(name):
-            ModuleRegistry.register(name, module_class)
-            ModuleRegistry.enable(name)
-
-
-# 自动注册
-_register_modules()
+)
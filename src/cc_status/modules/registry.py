@@ -24,6 +24,7 @@ class ModuleRegistry:
     _instances: dict[str, BaseModule] = {}
     _enabled_modules: list[str] = []
     _factory_functions: dict[str, Callable[[], BaseModule]] = {}
+    _pending_registrations: list[tuple[str, type[BaseModule]]] = []  # 待注册的内置模块
 
     def __new__(cls) -> "ModuleRegistry":
         """单例模式。"""
@@ -38,6 +39,7 @@ class ModuleRegistry:
         cls._instances.clear()
         cls._enabled_modules.clear()
         cls._factory_functions.clear()
+        cls._pending_registrations.clear()
         cls._instance = None
 
     @classmethod
@@ -54,6 +56,7 @@ class ModuleRegistry:
             module_class: 模块类
             factory: 可选的工厂函数，用于创建实例
         """
+        cls._ensure_registered()
         if name in cls._classes:
             raise ModuleLoadError(f"模块 '{name}' 已注册")
 
@@ -61,6 +64,51 @@ class ModuleRegistry:
         if factory is not None:
             cls._factory_functions[name] = factory
 
+    @classmethod
+    def register_if_absent(cls, name: str, module_class: type[BaseModule]) -> bool:
+        """在模块未注册时注册，已注册则保持不变。
+
+        Args:
+            name: 模块名称（唯一标识）
+            module_class: 模块类
+
+        Returns:
+            该名称是否对应此模块类（新注册或此前已注册同一类）
+        """
+        cls._ensure_registered()
+        return cls._classes.setdefault(name, module_class) is module_class
+
+    @classmethod
+    def register_deferred(cls, modules: list[tuple[str, type[BaseModule]]]) -> None:
+        """登记待注册的模块，首次查询注册表时再注册并启用。
+
+        模块文件导入时只追加到待注册列表，避免一次性命令（如 --version）
+        承担完整的注册开销。
+
+        Args:
+            modules: (模块名称, 模块类) 列表
+        """
+        cls._pending_registrations.extend(modules)
+
+    @classmethod
+    def bulk_register_pending(cls) -> None:
+        """注册并启用所有待注册的模块。"""
+        pending = list(cls._pending_registrations)
+        cls._pending_registrations.clear()
+        for name, module_class in pending:
+            if cls.register_if_absent(name, module_class):
+                cls.enable(name)
+
+    @classmethod
+    def _ensure_registered(cls) -> None:
+        """存在待注册模块时先完成注册。
+
+        所有读写注册状态的方法都应先调用，保证待注册模块不会在
+        禁用、注销或同名注册之后才被补注册。
+        """
+        if cls._pending_registrations:
+            cls.bulk_register_pending()
+
     @classmethod
     def unregister(cls, name: str) -> None:
         """注销模块。
@@ -68,6 +116,7 @@ class ModuleRegistry:
         Args:
             name: 模块名称
         """
+        cls._ensure_registered()
         cls._classes.pop(name, None)
         cls._instances.pop(name, None)
         cls._factory_functions.pop(name, None)
@@ -87,6 +136,7 @@ class ModuleRegistry:
         Raises:
             ModuleNotFoundError: 模块未找到
         """
+        cls._ensure_registered()
         if name not in cls._classes:
             raise ModuleNotFoundError(f"模块 '{name}' 未找到")
         return cls._classes[name]
@@ -105,6 +155,7 @@ class ModuleRegistry:
         Raises:
             ModuleNotFoundError: 模块未找到
         """
+        cls._ensure_registered()
         if name not in cls._classes:
             raise ModuleNotFoundError(f"模块 '{name}' 未找到")
 
@@ -126,6 +177,7 @@ class ModuleRegistry:
         Returns:
             是否已注册
         """
+        cls._ensure_registered()
         return name in cls._classes
 
     @classmethod
@@ -138,6 +190,7 @@ class ModuleRegistry:
         Returns:
             模块名称列表
         """
+        cls._ensure_registered()
         if enabled_only:
             return list(cls._enabled_modules)
         return list(cls._classes.keys())
@@ -162,6 +215,7 @@ class ModuleRegistry:
         Args:
             name: 模块名称
         """
+        cls._ensure_registered()
         if name in cls._classes and name not in cls._enabled_modules:
             cls._enabled_modules.append(name)
 
@@ -172,6 +226,7 @@ class ModuleRegistry:
         Args:
             name: 模块名称
         """
+        cls._ensure_registered()
         if name in cls._enabled_modules:
             cls._enabled_modules.remove(name)
 
@@ -185,6 +240,7 @@ class ModuleRegistry:
         Returns:
             是否已启用
         """
+        cls._ensure_registered()
         return name in cls._enabled_modules
 
     @classmethod
@@ -194,6 +250,7 @@ class ModuleRegistry:
         Returns:
             已启用模块实例列表
         """
+        cls._ensure_registered()
         instances = []
         for name in cls._enabled_modules:
             try:
@@ -211,6 +268,7 @@ class ModuleRegistry:
         Returns:
             最小刷新间隔（秒）
         """
+        cls._ensure_registered()
         intervals = []
         for name in cls._enabled_modules:
             try:
@@ -13,6 +13,7 @@ from cc_status.modules.base import (
     ModuleOutput,
     ModuleStatus,
 )
+from cc_status.modules.registry import ModuleRegistry
 
 
 class SessionTimeModule(BaseModule):
@@ -159,19 +160,5 @@ class SessionTimeModule(BaseModule):
         pass
 
 
-# 自动注册（仅在直接运行时执行，测试时会通过 conftest.py 处理）
-def _register_module() -> None:
-    """注册模块到注册表。"""
-    from cc_status.modules.registry import ModuleRegistry
-
-    # 检查是否已注册，避免重复注册
-    if not ModuleRegistry.has_module("session_time"):
-        ModuleRegistry.register(
-            "session_time",
-            SessionTimeModule,
-        )
-        ModuleRegistry.enable("session_time")
-
-
-# 自动注册
-_register_module()
+# 延迟注册：导入时仅登记，首次查询注册表时再注册并启用
+ModuleRegistry.register_deferred([("session_time", SessionTimeModule)])
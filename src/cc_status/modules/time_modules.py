@@ -3,7 +3,8 @@
 提供重置倒计时和计费窗口使用显示。
 """
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import Any, Optional
 
 from cc_status.modules.base import (
@@ -12,8 +13,24 @@ from cc_status.modules.base import (
     ModuleOutput,
     ModuleStatus,
 )
+from cc_status.modules.context import ParsedContext, parse_reset_time
 from cc_status.modules.registry import ModuleRegistry
 
+# 预绑定状态常量，避免热路径上重复的枚举属性查找
+_SUCCESS = ModuleStatus.SUCCESS
+_WARNING = ModuleStatus.WARNING
+_ERROR = ModuleStatus.ERROR
+_DISABLED = ModuleStatus.DISABLED
+
+# 共享的禁用输出，无数据时直接返回，避免重复构造
+_DISABLED_OUTPUT = ModuleOutput(text="", icon="", color="", status=_DISABLED)
+
+
+# 获取当前时间戳的辅助函数，测试可单独替换而不影响全局 time.time
+def _current_timestamp() -> float:
+    """获取当前时间戳。"""
+    return time.time()
+
 
 class ResetTimerModule(BaseModule):
     """重置倒计时模块。
@@ -23,7 +40,7 @@ class ResetTimerModule(BaseModule):
 
     def __init__(self) -> None:
         self._reset_time: Optional[datetime] = None
-        self._context: dict[str, Any] = {}
+        self._reset_ts: Optional[float] = None  # 重置时间的 Unix 时间戳（秒）
 
     @property
     def metadata(self) -> ModuleMetadata:
@@ -41,8 +58,20 @@ class ResetTimerModule(BaseModule):
 
     def set_context(self, context: dict[str, Any]) -> None:
         """设置上下文数据。"""
-        self._context = context
-        self._reset_time = self._extract_reset_time(context)
+        self._set_reset_time(self._extract_reset_time(context))
+
+    def set_parsed_context(self, parsed: ParsedContext) -> None:
+        """设置预解析的上下文快照。"""
+        self._set_reset_time(parsed.reset_time)
+
+    def _set_reset_time(self, reset_time: Optional[datetime]) -> None:
+        """保存重置时间，并预先转换为时间戳供每次刷新使用。
+
+        Args:
+            reset_time: 重置时间
+        """
+        self._reset_time = reset_time
+        self._reset_ts = reset_time.timestamp() if reset_time is not None else None
 
     def _extract_reset_time(self, context: dict[str, Any]) -> Optional[datetime]:
         """从上下文中提取重置时间。
@@ -53,53 +82,37 @@ class ResetTimerModule(BaseModule):
         Returns:
             重置时间，如果没有则返回 None
         """
-        # 尝试从 cost 数据中获取
-        cost_data = context.get("cost", {})
-        reset_timestamp = cost_data.get("next_reset_time")
-        if reset_timestamp:
-            try:
-                # 假设是 Unix 时间戳（秒）
-                return datetime.fromtimestamp(reset_timestamp)
-            except (ValueError, TypeError):
-                pass
-
-        # 如果没有提供，假设是当天午夜
-        now = datetime.now()
-        next_midnight = datetime(now.year, now.month, now.day) + timedelta(days=1)
-        return next_midnight
-
-    def _calculate_remaining(self) -> Optional[timedelta]:
-        """计算剩余时间。
+        return parse_reset_time(context)
+
+    def _calculate_remaining(self) -> Optional[float]:
+        """计算剩余秒数。
+
+        直接使用时间戳相减，避免每次刷新构造 datetime/timedelta 对象。
 
         Returns:
-            剩余时间，如果重置时间未知则返回 None
+            剩余秒数，如果重置时间未知则返回 None
         """
-        if self._reset_time is None:
+        if self._reset_ts is None:
             return None
-        remaining = self._reset_time - datetime.now()
-        if remaining.total_seconds() < 0:
-            return timedelta(0)
-        return remaining
+        remaining = self._reset_ts - _current_timestamp()
+        return 0.0 if remaining < 0 else remaining
 
-    def _format_duration(self, duration: timedelta) -> str:
-        """格式化持续时间。
+    def _format_seconds(self, total_seconds: int) -> str:
+        """格式化秒数。
 
         Args:
-            duration: 持续时间
+            total_seconds: 总秒数
 
         Returns:
             格式化后的字符串
         """
-        total_seconds = int(duration.total_seconds())
-        hours, remainder = divmod(total_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        if hours > 0:
-            return f"{hours}h {minutes}m"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
+        # 按量级直接计算所需字段，常见的小时分支无需计算秒数
+        if total_seconds >= 3600:
+            return f"{total_seconds // 3600}h {(total_seconds % 3600) // 60}m"
+        elif total_seconds >= 60:
+            return f"{total_seconds // 60}m {total_seconds % 60}s"
         else:
-            return f"{seconds}s"
+            return f"{total_seconds}s"
 
     def refresh(self) -> None:
         """刷新倒计时。"""
@@ -110,26 +123,20 @@ class ResetTimerModule(BaseModule):
         """获取模块输出。"""
         remaining = self._calculate_remaining()
         if remaining is None:
-            return ModuleOutput(
-                text="",
-                icon="",
-                color="",
-                status=ModuleStatus.DISABLED,
-            )
+            return _DISABLED_OUTPUT
 
-        formatted = self._format_duration(remaining)
+        formatted = self._format_seconds(int(remaining))
 
         # 根据剩余时间选择颜色
-        total_seconds = remaining.total_seconds()
-        if total_seconds < 300:  # 5分钟
+        if remaining < 300:  # 5分钟
             color = "red"
-            status = ModuleStatus.WARNING
-        elif total_seconds < 1800:  # 30分钟
+            status = _WARNING
+        elif remaining < 1800:  # 30分钟
             color = "yellow"
-            status = ModuleStatus.SUCCESS
+            status = _SUCCESS
         else:
             color = "green"
-            status = ModuleStatus.SUCCESS
+            status = _SUCCESS
 
         return ModuleOutput(
             text=formatted,
@@ -152,18 +159,9 @@ class ResetTimerModule(BaseModule):
         pass
 
 
-# 自动注册模块
-def _register_modules() -> None:
-    """注册所有时间相关模块。"""
-    modules = [
+# 延迟注册：导入时仅登记，首次查询注册表时再注册并启用
+ModuleRegistry.register_deferred(
+    [
         ("reset_timer", ResetTimerModule),
     ]
-
-    for name, module_class in modules:
-        if not ModuleRegistry.has_module(name):
-            ModuleRegistry.register(name, module_class)
-            ModuleRegistry.enable(name)
-
-
-# 自动注册
-_register_modules()
+)
@@ -1,5 +1,6 @@
 """pytest 配置和共享 fixtures"""
 
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -91,6 +92,25 @@ def invalid_yaml_file(tmp_path: Path) -> Path:
     return invalid_file
 
 
+@pytest.fixture
+def fake_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """将用户主目录指向临时目录，隔离 ~/.claude.json 等本机配置"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    return tmp_path
+
+
+# ============ 时间 fixtures ============
+@pytest.fixture
+def frozen_now():
+    """冻结当前时间，倒计时时间戳与 now_cached 返回同一时刻"""
+    frozen = datetime(2024, 1, 15, 12, 0)
+    timestamp = frozen.timestamp()
+    with patch("cc_status.modules.time_modules._current_timestamp", return_value=timestamp):
+        with patch("cc_status.modules.context.now_cached", return_value=frozen):
+            yield frozen
+
+
 # ============ 模块相关 fixtures ============
 @pytest.fixture
 def valid_module_output():
@@ -154,6 +174,21 @@ def sample_module_class():
     return SampleModule
 
 
+@pytest.fixture(scope="class")
+def _session_time_instance():
+    """同一测试类内共享的会话时间模块实例"""
+    from cc_status.modules.session_time import SessionTimeModule
+
+    return SessionTimeModule()
+
+
+@pytest.fixture
+def session_module(_session_time_instance):
+    """每个用例前重置状态的会话时间模块"""
+    _session_time_instance.reset()
+    return _session_time_instance
+
+
 # ============ 引擎相关 fixtures ============
 @pytest.fixture
 def engine_config():
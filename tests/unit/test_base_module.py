@@ -1,5 +1,9 @@
 """模块基类单元测试"""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from cc_status.modules.base import (
     ModuleError,
     ModuleLoadError,
@@ -56,6 +60,41 @@ class TestModuleOutput:
         assert output.tooltip == "Hint"
         assert output.style == "bold"
 
+    def test_lazy_tooltip(self) -> None:
+        """测试可调用提示信息按需格式化"""
+        calls = []
+
+        def tooltip() -> str:
+            calls.append(1)
+            return "Lazy"
+
+        output = ModuleOutput(text="Test", tooltip_factory=tooltip)
+        assert calls == []
+        assert output.tooltip == ""
+
+        assert output.get_tooltip() == "Lazy"
+        assert output.to_dict()["tooltip"] == "Lazy"
+        assert ModuleOutput(text="Test", tooltip="Hint").get_tooltip() == "Hint"
+
+    def test_lazy_tooltip_equality(self) -> None:
+        """测试延迟提示信息按格式化结果参与相等比较与哈希"""
+        first = ModuleOutput(text="Test", tooltip_factory=lambda: "A")
+        second = ModuleOutput(text="Test", tooltip_factory=lambda: "A")
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first == ModuleOutput(text="Test", tooltip="A")
+        assert first != ModuleOutput(text="Test", tooltip_factory=lambda: "B")
+
+    def test_string_tooltip_equality_and_dict(self) -> None:
+        """测试字符串提示信息的相等比较与字典转换保持原有行为"""
+        output = ModuleOutput(text="Test", tooltip="A")
+
+        assert output == ModuleOutput(text="Test", tooltip="A")
+        assert output != ModuleOutput(text="Test", tooltip="B")
+        assert output.to_dict()["tooltip"] == "A"
+        assert output != "Test"
+
     def test_to_dict_conversion(self) -> None:
         """测试转换为字典"""
         output = ModuleOutput(text="Test", icon="T", color="red")
@@ -79,6 +118,14 @@ class TestModuleOutput:
         output2 = ModuleOutput(text="Test")
         assert output1.text == output2.text
 
+    def test_immutable_and_hashable(self) -> None:
+        """测试输出不可变且可哈希"""
+        output = ModuleOutput(text="Test")
+
+        with pytest.raises(FrozenInstanceError):
+            output.text = "Changed"  # type: ignore[misc]
+        assert hash(output) == hash(ModuleOutput(text="Test"))
+
 
 class TestModuleMetadata:
     """ModuleMetadata 数据类测试"""
@@ -0,0 +1,86 @@
+"""上下文解析单元测试"""
+
+from datetime import datetime
+
+import pytest
+
+from cc_status.modules.context import ParsedContext, parse_percentage
+from cc_status.modules.model import ContextBarModule, ModelModule
+from cc_status.modules.time_modules import ResetTimerModule
+
+
+class TestParsedContext:
+    """上下文快照测试类"""
+
+    def test_from_raw(self) -> None:
+        """测试一次性解析所有字段"""
+        reset_at = datetime(2030, 1, 1, 12, 0)
+        raw = {
+            "model": {"id": "claude-opus-4", "display_name": "Opus"},
+            "context_window": {"used_percentage": 42.7},
+            "cost": {"next_reset_time": reset_at.timestamp()},
+        }
+
+        parsed = ParsedContext.from_raw(raw)
+
+        assert parsed.raw is raw
+        assert parsed.model == "Opus"
+        assert parsed.percentage == 42
+        assert parsed.reset_time == reset_at
+
+    def test_from_raw_empty(self) -> None:
+        """测试空上下文"""
+        parsed = ParsedContext.from_raw({})
+
+        assert parsed.model == ""
+        assert parsed.percentage == 0
+        assert parsed.reset_time is not None
+
+    def test_parse_percentage_sources(self) -> None:
+        """测试百分比的多种来源"""
+        assert parse_percentage({"cost": {"context_percentage": 55}}) == 55
+        assert parse_percentage({"tokens": {"used": 1, "limit": 4}}) == 25
+        assert parse_percentage({"tokens": {"used": 1, "limit": 0}}) == 0
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            {"context_window": {"used_percentage": "n/a"}},
+            {"cost": None},
+            {"tokens": {"used": "1", "limit": 2}},
+            {"cost": {"next_reset_time": 1e20}},
+        ],
+        ids=["bad-percentage", "null-cost", "bad-tokens", "overflow-timestamp"],
+    )
+    def test_from_raw_malformed_fields(self, raw: dict) -> None:
+        """测试字段格式异常时回退到默认值"""
+        parsed = ParsedContext.from_raw(raw)
+
+        assert parsed.percentage == 0
+        assert parsed.model == ""
+        assert parsed.reset_time == ParsedContext.from_raw({}).reset_time
+
+    def test_modules_accept_parsed_context(self) -> None:
+        """测试模块直接使用快照字段"""
+        parsed = ParsedContext.from_raw(
+            {"model": "claude-3-haiku", "context_window": {"used_percentage": 80}}
+        )
+        model = ModelModule()
+        bar = ContextBarModule()
+        timer = ResetTimerModule()
+
+        for module in (model, bar, timer):
+            module.set_parsed_context(parsed)
+
+        assert model.get_output().text == "Haiku"
+        assert bar.get_output().color == "yellow"
+        assert timer._reset_time == parsed.reset_time
+
+    def test_default_falls_back_to_set_context(self) -> None:
+        """测试未覆盖的模块回退到 set_context"""
+        from cc_status.modules.session_time import SessionTimeModule
+
+        module = SessionTimeModule()
+        module.set_parsed_context(ParsedContext.from_raw({"cost": {"total_duration_ms": 60000}}))
+
+        assert module._total_duration_ms == 60000
@@ -1,12 +1,27 @@
 """MCP 状态模块单元测试"""
 
-import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from cc_status.modules import mcp_status
 from cc_status.modules.base import ModuleStatus
 from cc_status.modules.mcp_status import MCPServerInfo, MCPStatusModule
 
+# 预序列化的 MCP 配置，避免每次运行用例时重复 json 编码
+_MCP_CONFIG_PAYLOAD = (
+    b'{"mcpServers": {'
+    b'"test-server": {"command": "npx", "args": ["-y", "@modelcontextprotocol/server-test"]}, '
+    b'"another-server": {"command": "python", "args": ["server.py"]}}}'
+)
+
+
+@pytest.fixture
+def no_async_update(monkeypatch: pytest.MonkeyPatch) -> None:
+    """禁用后台异步刷新，避免用例中触发真实检测"""
+    monkeypatch.setattr(MCPStatusModule, "_async_update_status", lambda self: None)
+
 
 class TestMCPServerInfo:
     """MCP 服务器信息测试类"""
@@ -42,25 +57,44 @@ class TestMCPStatusModule:
         assert metadata.author == "Claude Code"
         assert metadata.enabled is True
 
+    def test_parse_command_output(self) -> None:
+        """测试解析命令输出"""
+        servers = MCPStatusModule._parse_command_output(
+            "Checking MCP server health...\n"
+            "server1: npx -y server1 - ✓ Connected\n"
+            "server2: npx -y server2 - ✓ Connected\n"
+            "server3: python server3.py - ✓ Connected\n"
+        )
+
+        assert [s.name for s in servers] == ["server1", "server2", "server3"]
+        assert all(s.status == "running" for s in servers)
+
+    def test_parse_command_output_skips_disconnected(self) -> None:
+        """测试跳过未连接的服务器行"""
+        servers = MCPStatusModule._parse_command_output(
+            "server1: npx -y server1 - ✓ Connected\n"
+            "server2: npx -y server2 - ✗ Failed to connect\n"
+            "\n"
+        )
+
+        assert [s.name for s in servers] == ["server1"]
+
+    def test_parse_command_output_empty(self) -> None:
+        """测试空输出"""
+        assert MCPStatusModule._parse_command_output("") == []
+        assert MCPStatusModule._parse_command_output("Checking MCP server health...\n") == []
+
     @patch("cc_status.modules.mcp_status.subprocess.run")
     def test_detect_servers_from_command(self, mock_run: MagicMock) -> None:
         """测试从命令检测服务器"""
-        # 模拟新的命令输出格式
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="Checking MCP server health...\n"
-            "server1: npx -y server1 - ✓ Connected\n"
-            "server2: npx -y server2 - ✓ Connected\n"
-            "server3: python server3.py - ✓ Connected\n",
+            stdout="server1: npx -y server1 - ✓ Connected\n",
         )
 
         module = MCPStatusModule()
         servers = module._get_from_claude_command()
-        assert len(servers) == 3
-        assert servers[0].name == "server1"
-        assert servers[0].status == "running"
-        assert servers[1].name == "server2"
-        assert servers[1].status == "running"
+        assert [s.name for s in servers] == ["server1"]
 
     @patch("cc_status.modules.mcp_status.subprocess.run")
     def test_detect_servers_command_fails(self, mock_run: MagicMock) -> None:
@@ -102,23 +136,8 @@ class TestMCPStatusModule:
 
     def test_parse_mcp_config(self, tmp_path: Path) -> None:
         """测试解析 MCP 配置文件"""
-        # 创建临时配置文件
-        config_data = {
-            "mcpServers": {
-                "test-server": {
-                    "command": "npx",
-                    "args": ["-y", "@modelcontextprotocol/server-test"],
-                },
-                "another-server": {
-                    "command": "python",
-                    "args": ["server.py"],
-                },
-            }
-        }
-
         config_file = tmp_path / "mcp.json"
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config_data, f)
+        config_file.write_bytes(_MCP_CONFIG_PAYLOAD)
 
         module = MCPStatusModule()
         servers = module._parse_mcp_config_for_test(config_file)
@@ -132,18 +151,29 @@ class TestMCPStatusModule:
     def test_parse_mcp_config_invalid_json(self, tmp_path: Path) -> None:
         """测试解析无效 JSON 配置文件"""
         config_file = tmp_path / "mcp.json"
-        with open(config_file, "w", encoding="utf-8") as f:
-            f.write("invalid json")
+        config_file.write_text("invalid json")
 
         module = MCPStatusModule()
         servers = module._parse_mcp_config_for_test(config_file)
         assert len(servers) == 0
 
+    @patch("cc_status.modules.mcp_status._path_exists", return_value=False)
+    def test_get_from_config_missing_file(self, mock_exists: MagicMock) -> None:
+        """测试配置文件不存在时返回空列表并缓存"""
+        module = MCPStatusModule()
+
+        with patch("builtins.open") as mock_file:
+            assert module._get_from_config() == []
+            assert module._get_from_config() == []
+
+        mock_file.assert_not_called()
+        mock_exists.assert_called_once()
+
     @patch("cc_status.modules.mcp_status.subprocess.run")
-    @patch("cc_status.modules.mcp_status.Path.exists")
-    def test_get_output_no_servers(self, mock_exists: MagicMock, mock_run: MagicMock) -> None:
+    @pytest.mark.usefixtures("fake_home")
+    def test_get_output_no_servers(self, mock_run: MagicMock) -> None:
         """测试无服务器时的输出"""
-        mock_exists.return_value = False  # 模拟配置文件不存在
+        # 临时主目录为空，配置文件真实不存在
         mock_run.side_effect = FileNotFoundError()
 
         module = MCPStatusModule()
@@ -176,12 +206,11 @@ class TestMCPStatusModule:
         assert output.color == "green"
         assert output.status == ModuleStatus.SUCCESS
 
-    @patch("cc_status.modules.mcp_status._get_current_time")
-    @patch("cc_status.modules.mcp_status.MCPStatusModule._async_update_status")
-    def test_get_output_partial_running(self, mock_async: MagicMock, mock_time: MagicMock) -> None:
+    @pytest.mark.usefixtures("no_async_update")
+    def test_get_output_partial_running(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """测试部分服务器运行中的输出（通过手动设置）"""
-        # Mock 当前时间为接近 _last_update，避免缓存超时
-        mock_time.return_value = 125.0  # 只过了 2 秒，未超过 60 秒缓存
+        # 当前时间接近 _last_update，避免缓存超时（只过了 2 秒，未超过 60 秒缓存）
+        monkeypatch.setattr(mcp_status, "_get_current_time", lambda: 125.0)
 
         module = MCPStatusModule()
 
@@ -202,12 +231,11 @@ class TestMCPStatusModule:
         assert output.color == "yellow"
         assert output.status == ModuleStatus.WARNING
 
-    @patch("cc_status.modules.mcp_status._get_current_time")
-    @patch("cc_status.modules.mcp_status.MCPStatusModule._async_update_status")
-    def test_get_output_with_errors(self, mock_async: MagicMock, mock_time: MagicMock) -> None:
+    @pytest.mark.usefixtures("no_async_update")
+    def test_get_output_with_errors(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """测试有错误服务器的输出"""
-        # Mock 当前时间为接近 _last_update，避免缓存超时
-        mock_time.return_value = 125.0  # 只过了 2 秒，未超过 60 秒缓存
+        # 当前时间接近 _last_update，避免缓存超时（只过了 2 秒，未超过 60 秒缓存）
+        monkeypatch.setattr(mcp_status, "_get_current_time", lambda: 125.0)
 
         module = MCPStatusModule()
 
@@ -228,15 +256,9 @@ class TestMCPStatusModule:
         assert output.color == "red"
         assert output.status == ModuleStatus.ERROR
 
-    @patch("cc_status.modules.mcp_status.subprocess.run")
-    @patch("cc_status.modules.mcp_status.MCPStatusModule._async_update_status")
-    def test_get_server_details(self, mock_async: MagicMock, mock_run: MagicMock) -> None:
+    @pytest.mark.usefixtures("no_async_update")
+    def test_get_server_details(self) -> None:
         """测试获取服务器详细信息"""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="Checking MCP server health...\n" "server1: npx -y server1 - ✓ Connected\n",
-        )
-
         module = MCPStatusModule()
         # 模拟配置中只有 1 个服务器
         module._all_configured = ["server1"]
@@ -260,37 +282,25 @@ class TestMCPStatusModule:
         module = MCPStatusModule()
         assert module.get_refresh_interval() == 10.0
 
-    @patch("cc_status.modules.mcp_status.subprocess.run")
-    def test_cleanup(self, mock_run: MagicMock) -> None:
+    def test_cleanup(self, fake_home: Path) -> None:
         """测试清理资源"""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="Checking MCP server health...\n" "server1: npx -y server1 - ✓ Connected\n",
-        )
+        # 使用临时主目录中的已知配置，不依赖本机 ~/.claude.json
+        (fake_home / ".claude.json").write_bytes(_MCP_CONFIG_PAYLOAD)
 
         module = MCPStatusModule()
-        module.refresh()  # 使用 refresh 初始化
-        assert len(module._servers) > 0
+        module.refresh()  # 首次刷新为快速模式，仅读取配置
+        assert set(module._servers) == {"test-server", "another-server"}
 
         module.cleanup()
-        assert len(module._servers) == 0
+        assert (module._servers, module._all_configured, module._config_cache) == ({}, [], None)
 
-    @patch("cc_status.modules.mcp_status.subprocess.run")
-    @patch("cc_status.modules.mcp_status.MCPStatusModule._async_update_status")
-    def test_refresh(self, mock_async: MagicMock, mock_run: MagicMock) -> None:
+    @pytest.mark.usefixtures("no_async_update")
+    def test_refresh(self) -> None:
         """测试刷新功能"""
         module = MCPStatusModule()
         # 清除待处理的异步任务
         module._pending_update = None
 
-        # 模拟命令返回 2 个服务器
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="Checking MCP server health...\n"
-            "server1: npx -y server1 - ✓ Connected\n"
-            "server2: npx -y server2 - ✓ Connected\n",
-        )
-
         # 直接设置 _all_configured 和 _servers，模拟 refresh 完成后的状态
         module._all_configured = ["server1", "server2"]
         module._servers = {
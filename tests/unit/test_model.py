@@ -0,0 +1,232 @@
+"""模型与上下文模块单元测试"""
+
+from unittest.mock import patch
+
+from cc_status.modules.base import ModuleStatus
+from cc_status.modules.context import _classify_model
+from cc_status.modules.model import (
+    ContextBarModule,
+    ContextPercentModule,
+    ModelModule,
+)
+
+
+class TestClassifyModel:
+    """模型名称分类测试类"""
+
+    def test_known_families(self) -> None:
+        """测试已知模型系列的简化"""
+        assert _classify_model("claude-sonnet-4-5") == "Sonnet"
+        assert _classify_model("Opus") == "Opus"
+        assert _classify_model("claude-3-haiku") == "Haiku"
+
+    def test_claude_with_version(self) -> None:
+        """测试带版本号的 Claude 名称"""
+        assert _classify_model("Claude 3.5") == "Claude 3.5"
+        assert _classify_model("claude") == "Claude"
+
+    def test_family_takes_priority_over_claude(self) -> None:
+        """测试系列名优先于 claude 前缀"""
+        assert _classify_model("claude-3-opus-20240229") == "Opus"
+        assert _classify_model("CLAUDE-SONNET-4") == "Sonnet"
+
+    def test_multiple_families_keep_priority(self) -> None:
+        """测试同时包含多个系列名时按 sonnet、opus、haiku 的顺序判定"""
+        assert _classify_model("opus-distilled-sonnet") == "Sonnet"
+        assert _classify_model("haiku-vs-opus") == "Opus"
+
+    def test_unknown_model(self) -> None:
+        """测试未知模型原样返回"""
+        assert _classify_model("gpt-4") == "gpt-4"
+
+    def test_cached(self) -> None:
+        """测试重复调用命中缓存"""
+        _classify_model.cache_clear()
+        _classify_model("claude-opus-4")
+        _classify_model("claude-opus-4")
+
+        info = _classify_model.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+
+class TestModelModule:
+    """模型模块测试类"""
+
+    def test_set_context_dict_format(self) -> None:
+        """测试对象格式的模型数据"""
+        module = ModelModule()
+        module.set_context({"model": {"id": "claude-opus-4", "display_name": "Opus"}})
+
+        assert module.is_available() is True
+        output = module.get_output()
+        assert output.text == "Opus"
+        assert output.status == ModuleStatus.SUCCESS
+
+    def test_set_context_string_format(self) -> None:
+        """测试字符串格式的模型数据"""
+        module = ModelModule()
+        module.set_context({"model": "claude-3-5-sonnet"})
+
+        assert module.get_output().text == "Sonnet"
+
+    def test_no_model(self) -> None:
+        """测试无模型数据时禁用"""
+        module = ModelModule()
+        module.set_context({})
+
+        assert module.is_available() is False
+        assert module.get_output().status == ModuleStatus.DISABLED
+
+    def test_bool_reflects_availability(self) -> None:
+        """测试模块真值与可用性一致"""
+        module = ModelModule()
+        assert not module
+
+        module.set_context({"model": "claude-opus-4"})
+        assert module
+
+
+class TestContextModules:
+    """上下文模块测试类"""
+
+    def test_percent_thresholds(self) -> None:
+        """测试百分比颜色阈值"""
+        module = ContextPercentModule()
+
+        module.set_context({"context_window": {"used_percentage": 50}})
+        assert module.get_output().color == "green"
+
+        module.set_context({"context_window": {"used_percentage": 75}})
+        assert module.get_output().color == "yellow"
+
+        module.set_context({"context_window": {"used_percentage": 95}})
+        output = module.get_output()
+        assert output.color == "red"
+        assert output.status == ModuleStatus.ERROR
+        assert output.text == "95%"
+
+    def test_threshold_boundaries(self) -> None:
+        """测试阈值边界"""
+        module = ContextBarModule()
+        expected = {69: "green", 70: "yellow", 89: "yellow", 90: "red", 100: "red"}
+
+        for pct, color in expected.items():
+            module.set_context({"context_window": {"used_percentage": pct}})
+            assert module.get_output().color == color
+
+    def test_percent_from_tokens(self) -> None:
+        """测试从 tokens 计算百分比"""
+        module = ContextPercentModule()
+        module.set_context({"tokens": {"used": 25, "limit": 100}})
+
+        assert module.get_output().text == "25%"
+
+    def test_bar_render(self) -> None:
+        """测试进度条渲染"""
+        module = ContextBarModule()
+        module.set_context({"context_window": {"used_percentage": 30}})
+
+        output = module.get_output()
+        assert output.text == "[███░░░░░░░] 30%"
+        assert output.color == "green"
+
+    def test_bar_disabled(self) -> None:
+        """测试无上下文时禁用"""
+        module = ContextBarModule()
+        module.set_context({})
+
+        assert module.get_output().status == ModuleStatus.DISABLED
+
+    def test_disabled_output_shared(self) -> None:
+        """测试禁用输出为共享实例"""
+        assert ContextBarModule().get_output() is ContextPercentModule().get_output()
+        assert ModelModule().get_output() is ContextBarModule().get_output()
+
+
+class TestOutputCache:
+    """输出缓存测试类"""
+
+    def test_model_output_reused(self) -> None:
+        """测试模型未变化时复用输出"""
+        module = ModelModule()
+        module.set_context({"model": "claude-opus-4"})
+        first = module.get_output()
+        module.set_context({"model": "claude-opus-4"})
+
+        assert module.get_output() is first
+
+        module.set_context({"model": "claude-3-haiku"})
+        assert module.get_output() is not first
+        assert module.get_output().text == "Haiku"
+
+    def test_model_outputs_equal_across_instances(self) -> None:
+        """测试不同实例对同一模型的输出相等"""
+        first, second = ModelModule(), ModelModule()
+        first.set_context({"model": "claude-opus-4"})
+        second.set_context({"model": "claude-opus-4"})
+
+        assert first.get_output() == second.get_output()
+
+    def test_percent_output_reused(self) -> None:
+        """测试百分比未变化时复用输出"""
+        module = ContextPercentModule()
+        module.set_context({"context_window": {"used_percentage": 40}})
+        first = module.get_output()
+        module.refresh()
+
+        assert module.get_output() is first
+
+        module.set_context({"context_window": {"used_percentage": 41}})
+        assert module.get_output().text == "41%"
+
+    def test_refresh_skips_unchanged_context(self) -> None:
+        """测试上下文未重新绑定时 refresh 跳过重新计算"""
+        module = ContextBarModule()
+        module.set_context({"context_window": {"used_percentage": 40}})
+        module.refresh()
+
+        with patch.object(module, "_calculate_percentage") as mock_calc:
+            module.refresh()
+
+        mock_calc.assert_not_called()
+        assert module._percentage == 40
+
+    def test_set_context_computes_once(self) -> None:
+        """测试 set_context 后 refresh 与 get_output 只计算一次"""
+        module = ContextPercentModule()
+
+        with patch.object(module, "_calculate_percentage", return_value=40) as mock_calc:
+            module.set_context({"context_window": {"used_percentage": 40}})
+            module.refresh()
+            module.get_output()
+
+        mock_calc.assert_called_once()
+
+    def test_refresh_interval_backoff(self) -> None:
+        """测试百分比稳定时刷新间隔指数退避"""
+        module = ContextPercentModule()
+        module.set_context({"context_window": {"used_percentage": 40}})
+
+        module.refresh()
+        assert module.get_refresh_interval() == 5.0
+
+        intervals = []
+        for _ in range(6):
+            module.refresh()
+            intervals.append(module.get_refresh_interval())
+        assert intervals == [10.0, 20.0, 40.0, 60.0, 60.0, 60.0]
+
+        module.set_context({"context_window": {"used_percentage": 41}})
+        assert module.get_refresh_interval() == 5.0
+
+    def test_context_released_after_compute(self) -> None:
+        """测试计算百分比后不再持有上下文引用"""
+        module = ContextPercentModule()
+        module.set_context({"context_window": {"used_percentage": 40}})
+        assert module._dirty is True
+        module.get_output()
+
+        assert module._dirty is False
+        assert module._pending_context is None
+        assert module._percentage == 40
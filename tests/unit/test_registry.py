@@ -39,6 +39,54 @@ class TestModuleRegistryBasicOperations:
         with pytest.raises(ModuleLoadError, match="已注册"):
             ModuleRegistry.register("test", sample_module_class)
 
+    def test_register_if_absent(self, sample_module_class) -> None:
+        """测试仅在未注册时注册"""
+        assert ModuleRegistry.register_if_absent("test", sample_module_class) is True
+        assert ModuleRegistry.get_class("test") is sample_module_class
+
+        other_class = type("OtherModule", (sample_module_class,), {})
+        assert ModuleRegistry.register_if_absent("test", other_class) is False
+        assert ModuleRegistry.get_class("test") is sample_module_class
+
+    def test_register_deferred(self, sample_module_class) -> None:
+        """测试延迟注册在首次查询时生效"""
+        ModuleRegistry.register_deferred([("test", sample_module_class)])
+        assert "test" not in ModuleRegistry._classes
+
+        assert ModuleRegistry.has_module("test")
+        assert ModuleRegistry.is_enabled("test")
+        assert ModuleRegistry._pending_registrations == []
+
+    def test_disable_before_first_query(self, sample_module_class) -> None:
+        """测试首次查询前禁用延迟注册的模块不会被重新启用"""
+        ModuleRegistry.register_deferred([("test", sample_module_class)])
+        ModuleRegistry.disable("test")
+
+        assert ModuleRegistry.has_module("test")
+        assert not ModuleRegistry.is_enabled("test")
+
+    def test_unregister_before_first_query(self, sample_module_class) -> None:
+        """测试首次查询前注销延迟注册的模块不会被补注册"""
+        ModuleRegistry.register_deferred([("test", sample_module_class)])
+        ModuleRegistry.unregister("test")
+
+        assert not ModuleRegistry.has_module("test")
+
+    def test_register_conflicts_with_deferred(self, sample_module_class) -> None:
+        """测试与待注册模块同名注册时报错"""
+        ModuleRegistry.register_deferred([("test", sample_module_class)])
+
+        with pytest.raises(ModuleLoadError):
+            ModuleRegistry.register("test", sample_module_class)
+        assert ModuleRegistry.is_enabled("test")
+
+    def test_reset_clears_deferred(self, sample_module_class) -> None:
+        """测试重置时清空待注册列表"""
+        ModuleRegistry.register_deferred([("test", sample_module_class)])
+        ModuleRegistry.reset()
+
+        assert not ModuleRegistry.has_module("test")
+
     def test_unregister_module(self, sample_module_class) -> None:
         """测试注销模块"""
         ModuleRegistry.register("test", sample_module_class)
@@ -1,19 +1,33 @@
 """会话时间模块单元测试"""
 
 from datetime import timedelta
+from typing import Optional
+
+import pytest
 
 from cc_status.modules.base import ModuleStatus
+from cc_status.modules.session_time import SessionTimeModule
+
+_SUCCESS = ModuleStatus.SUCCESS
+
+# 会话时长输出用例表：(总时长毫秒, (文本, 图标, 颜色, 状态))，含无数据与 1h/2h 边界
+_SESSION_CASES = [
+    (None, ("--:--", "⏱️", "gray", _SUCCESS)),
+    (1800000, ("30m 0s", "⏱️", "blue", _SUCCESS)),
+    (3600000, ("1h 0m", "⏱️", "yellow", _SUCCESS)),
+    (5400000, ("1h 30m", "⏱️", "yellow", _SUCCESS)),
+    (7200000, ("2h 0m", "⏱️", "green", _SUCCESS)),
+    (10800000, ("3h 0m", "⏱️", "green", _SUCCESS)),
+]
+_SESSION_CASE_IDS = ["no-data", "short", "1h-boundary", "medium", "2h-boundary", "long"]
 
 
 class TestSessionTimeModuleLogic:
-    """会话时间模块逻辑测试（不依赖导入）"""
+    """会话时间模块逻辑测试"""
 
     def test_metadata_values(self) -> None:
         """测试模块元数据值"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-        metadata = module.metadata
+        metadata = SessionTimeModule().metadata
 
         assert metadata.name == "session_time"
         assert metadata.description == "显示当前会话使用时间"
@@ -21,193 +35,114 @@ class TestSessionTimeModuleLogic:
         assert metadata.author == "Claude Code"
         assert metadata.enabled is True
 
-    def test_calculate_elapsed_with_context(self) -> None:
+    def test_calculate_elapsed_with_context(self, session_module) -> None:
         """测试从上下文计算经过时间"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-
         # 设置上下文（12.5 小时 = 45000000 毫秒）
         context = {"cost": {"total_duration_ms": 45000000}}
-        module.set_context(context)
+        session_module.set_context(context)
 
-        elapsed = module._calculate_elapsed()
+        elapsed = session_module._calculate_elapsed()
 
         assert elapsed is not None
         assert elapsed.total_seconds() == 45000
         assert elapsed == timedelta(hours=12, minutes=30)
 
-    def test_calculate_elapsed_no_context(self) -> None:
+    def test_calculate_elapsed_no_context(self, session_module) -> None:
         """测试无上下文时返回 None"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-
-        elapsed = module._calculate_elapsed()
+        elapsed = session_module._calculate_elapsed()
 
         assert elapsed is None
 
-    def test_format_elapsed_hours(self) -> None:
-        """测试短格式时间（小时）"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-        elapsed = timedelta(hours=2, minutes=30)
-
-        assert module._format_elapsed(elapsed) == "2h 30m"
-
-    def test_format_elapsed_minutes(self) -> None:
-        """测试短格式时间（分钟）"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-        elapsed = timedelta(minutes=15, seconds=30)
+    def test_get_elapsed(self, session_module) -> None:
+        """测试获取经过时间（直接读取上次计算结果）"""
+        assert session_module.get_elapsed() is None
 
-        assert module._format_elapsed(elapsed) == "15m 30s"
+        session_module._last_elapsed = timedelta(minutes=30)
 
-    def test_format_elapsed_seconds(self) -> None:
-        """测试短格式时间（秒）"""
-        from cc_status.modules.session_time import SessionTimeModule
+        assert session_module.get_elapsed() == timedelta(minutes=30)
 
-        module = SessionTimeModule()
-        elapsed = timedelta(seconds=45)
+    @pytest.mark.parametrize(
+        "elapsed,expected",
+        [
+            (timedelta(hours=2, minutes=30), "2h 30m"),
+            (timedelta(minutes=15, seconds=30), "15m 30s"),
+            (timedelta(seconds=45), "45s"),
+        ],
+        ids=["hours", "minutes", "seconds"],
+    )
+    def test_format_elapsed(self, session_module, elapsed: timedelta, expected: str) -> None:
+        """测试时间格式化"""
+        assert session_module._format_elapsed(elapsed) == expected
 
-        assert module._format_elapsed(elapsed) == "45s"
-
-    def test_reset(self) -> None:
+    def test_reset(self, session_module) -> None:
         """测试重置计时"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-
-        module._last_elapsed = timedelta(hours=5)
-        module._total_duration_ms = 18000000
-
-        module.reset()
-
-        assert module._last_elapsed is None
-        assert module._total_duration_ms is None
-
-    def test_get_output_no_elapsed(self) -> None:
-        """测试获取输出（无时间数据）"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-
-        output = module.get_output()
-
-        assert output.text == "--:--"
-        assert output.icon == "⏱️"
-        assert output.color == "gray"
-        assert output.status == ModuleStatus.SUCCESS
-
-    def test_get_output_short_session(self) -> None:
-        """测试获取输出（短会话 < 1h）"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
+        session_module.set_context({"cost": {"total_duration_ms": 18000000}})
+        session_module.refresh()
+        assert session_module.get_elapsed() == timedelta(hours=5)
 
-        context = {"cost": {"total_duration_ms": 1800000}}
-        module.set_context(context)
+        session_module.reset()
 
-        output = module.get_output()
+        assert session_module._last_elapsed is None
+        assert session_module._total_duration_ms is None
+        assert session_module.get_elapsed() is None
+        assert session_module.get_output().text == "--:--"
 
-        assert "30m" in output.text
-        assert output.color == "blue"
+    @pytest.mark.parametrize("duration_ms,expected", _SESSION_CASES, ids=_SESSION_CASE_IDS)
+    def test_get_output(self, session_module, duration_ms: Optional[int], expected: tuple) -> None:
+        """测试获取输出（无数据 / 短会话 < 1h / 中等会话 1-2h / 长会话 >= 2h）"""
+        session_module.set_context({"cost": {"total_duration_ms": duration_ms}})
 
-    def test_get_output_medium_session(self) -> None:
-        """测试获取输出（中等会话 1-2h）"""
-        from cc_status.modules.session_time import SessionTimeModule
+        output = session_module.get_output()
 
-        module = SessionTimeModule()
+        assert (output.text, output.icon, output.color, output.status) == expected
 
-        context = {"cost": {"total_duration_ms": 5400000}}
-        module.set_context(context)
-
-        output = module.get_output()
-
-        assert "1h" in output.text
-        assert output.color == "yellow"
-
-    def test_get_output_long_session(self) -> None:
-        """测试获取输出（长会话 >= 2h）"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-
-        context = {"cost": {"total_duration_ms": 10800000}}
-        module.set_context(context)
-
-        output = module.get_output()
-
-        assert "3h" in output.text
-        assert output.color == "green"
-
-    def test_is_available(self) -> None:
+    def test_is_available(self, session_module) -> None:
         """测试模块可用性检查"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-        assert module.is_available() is True
+        assert session_module.is_available() is True
 
-    def test_get_refresh_interval(self) -> None:
+    def test_get_refresh_interval(self, session_module) -> None:
         """测试获取刷新间隔"""
-        from cc_status.modules.session_time import SessionTimeModule
+        assert session_module.get_refresh_interval() == 1.0
 
-        module = SessionTimeModule()
-        assert module.get_refresh_interval() == 1.0
-
-    def test_refresh(self) -> None:
+    def test_refresh(self, session_module) -> None:
         """测试刷新功能"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-        module.set_context({"cost": {"total_duration_ms": 3600000}})
-        module.refresh()
-
-        assert module._last_elapsed is not None
-        assert module._last_elapsed.total_seconds() == 3600
-
-    def test_set_context(self) -> None:
+        session_module.set_context({"cost": {"total_duration_ms": 3600000}})
+        session_module.refresh()
+
+        assert session_module._last_elapsed is not None
+        assert session_module._last_elapsed.total_seconds() == 3600
+
+    @pytest.mark.parametrize(
+        "context,expected_ms",
+        [
+            (
+                {
+                    "hook_event_name": "Status",
+                    "session_id": "abc123",
+                    "cost": {
+                        "total_cost_usd": 0.01234,
+                        "total_duration_ms": 45000000,
+                    },
+                },
+                45000000,
+            ),
+            ({"cost": {"total_cost_usd": 0.01234}}, None),
+            ({}, None),
+        ],
+        ids=["full", "no-duration", "empty"],
+    )
+    def test_set_context(self, session_module, context: dict, expected_ms: Optional[int]) -> None:
         """测试设置上下文数据"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-
-        context = {
-            "hook_event_name": "Status",
-            "session_id": "abc123",
-            "cost": {
-                "total_cost_usd": 0.01234,
-                "total_duration_ms": 45000000,
-            },
-        }
-
-        module.set_context(context)
-
-        assert module._context == context
-        assert module._total_duration_ms == 45000000
+        session_module.set_context(context)
 
-    def test_set_context_empty(self) -> None:
-        """测试设置空上下文"""
-        from cc_status.modules.session_time import SessionTimeModule
+        assert session_module._context == context
+        assert session_module._total_duration_ms == expected_ms
 
-        module = SessionTimeModule()
-
-        module.set_context({})
-
-        assert module._context == {}
-        assert module._total_duration_ms is None
-
-    def test_get_output_tooltip(self) -> None:
+    def test_get_output_tooltip(self, session_module) -> None:
         """测试 tooltip 显示"""
-        from cc_status.modules.session_time import SessionTimeModule
-
-        module = SessionTimeModule()
-
         context = {"cost": {"total_duration_ms": 7200000}}
-        module.set_context(context)
+        session_module.set_context(context)
 
-        output = module.get_output()
+        output = session_module.get_output()
 
-        assert output.tooltip == "会话时长: 2h 0m"
+        assert output.get_tooltip() == "会话时长: 2h 0m"
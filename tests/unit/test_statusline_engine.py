@@ -7,7 +7,7 @@ from cc_status.engine.statusline_engine import (
     EngineConfig,
     StatuslineEngine,
 )
-from cc_status.modules.base import ModuleOutput
+from cc_status.modules.base import ModuleOutput, ModuleStatus
 
 
 class TestEngineConfig:
@@ -244,6 +244,117 @@ class TestStatuslineEngineRefresh:
                 # 验证模块被处理
                 assert len(engine._scheduler._tasks) > 0
 
+    def test_refresh_module_updates_interval(self, engine, mock_base_module) -> None:
+        """测试刷新后按模块当前刷新间隔更新调度任务"""
+        mock_base_module.get_refresh_interval.return_value = 20.0
+
+        with patch.object(engine._scheduler, "update_interval") as mock_update:
+            engine._refresh_module(mock_base_module)()
+
+        mock_update.assert_called_once_with("test_module", 20.0)
+
+    def test_refresh_skips_unavailable_module(self, engine) -> None:
+        """测试不可用模块跳过 get_output 并记录禁用输出"""
+        from cc_status.modules.model import ModelModule
+
+        module = ModelModule()
+        engine._outputs["model"] = ModuleOutput(text="stale")
+
+        with patch.object(module, "get_output") as mock_output:
+            engine._refresh_module(module)()
+
+        mock_output.assert_not_called()
+        assert engine.get_outputs()["model"].status is ModuleStatus.DISABLED
+
+    def test_refresh_uses_cached_availability(self, engine) -> None:
+        """测试刷新时复用 set_context 缓存的可用性，不重复计算燃烧率"""
+        from cc_status.modules.cost import BurnRateModule
+
+        module = BurnRateModule()
+        module.set_context({"cost": {"total_cost_usd": 1.5, "total_duration_ms": 3600000}})
+
+        with patch.object(module, "_calculate_burn_rate") as mock_calc:
+            engine._refresh_module(module)()
+
+        mock_calc.assert_not_called()
+        assert engine.get_outputs()["burn_rate"].text == "$1.50/h"
+
+
+class TestStatuslineEngineContext:
+    """上下文分发测试"""
+
+    def test_set_context_shares_parsed_snapshot(self, engine) -> None:
+        """测试所有模块收到同一个解析快照"""
+        modules = [MagicMock(), MagicMock()]
+        context = {"model": "claude-opus-4"}
+
+        with patch.object(engine, "_modules", modules):
+            engine.set_context(context)
+
+        first = modules[0].set_parsed_context.call_args[0][0]
+        second = modules[1].set_parsed_context.call_args[0][0]
+        assert first is second
+        assert first.raw is context
+        assert first.model == "Opus"
+
+    def test_set_context_fallback(self, engine) -> None:
+        """测试不支持快照的模块回退到 set_context"""
+        module = MagicMock(spec=["set_context"])
+        context = {"model": "claude-opus-4"}
+
+        with patch.object(engine, "_modules", [module]):
+            engine.set_context(context)
+
+        module.set_context.assert_called_once_with(context)
+
+    def test_set_context_malformed_field(self, engine) -> None:
+        """测试单个字段格式异常时其他模块仍正常更新"""
+        from cc_status.modules.model import ContextPercentModule, ModelModule
+        from cc_status.modules.time_modules import ResetTimerModule
+
+        model = ModelModule()
+        percent = ContextPercentModule()
+        timer = ResetTimerModule()
+        context = {
+            "model": "claude-opus-4",
+            "context_window": {"used_percentage": 40},
+            "cost": None,
+        }
+
+        with patch.object(engine, "_modules", [model, percent, timer]):
+            engine.set_context(context)
+
+        assert model.get_output().text == "Opus"
+        assert percent.get_output().text == "40%"
+        assert timer.is_available() is True
+
+    def test_set_context_not_retained(self, engine) -> None:
+        """测试模块只保留提取的字段，不持有原始上下文"""
+        from cc_status.modules.basic import VersionModule
+        from cc_status.modules.cost import BurnRateModule, CostSessionModule
+        from cc_status.modules.realtime import ActivityIndicatorModule, TodoProgressModule
+
+        modules = [
+            VersionModule(),
+            CostSessionModule(),
+            BurnRateModule(),
+            TodoProgressModule(),
+            ActivityIndicatorModule(),
+        ]
+        context = {
+            "version": "1.0.80",
+            "cost": {"total_cost_usd": 1.5, "total_duration_ms": 3600000},
+            "todo": {"total": 4, "completed": 1},
+            "active_tools": [{"name": "Bash"}],
+        }
+
+        with patch.object(engine, "_modules", modules):
+            engine.set_context(context)
+
+        for module in modules:
+            assert module.is_available() is True
+            assert all(value is not context for value in vars(module).values())
+
 
 class TestStatuslineEngineLifecycle:
     """生命周期测试（使用 mock）"""
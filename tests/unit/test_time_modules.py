@@ -0,0 +1,111 @@
+"""时间与计费模块单元测试"""
+
+from datetime import datetime, timedelta
+from typing import Final
+from unittest.mock import patch
+
+from cc_status.modules import _clock
+from cc_status.modules.base import ModuleStatus
+from cc_status.modules.context import _next_midnight
+from cc_status.modules.time_modules import ResetTimerModule
+
+# frozen_now（见 conftest）对应的次日午夜
+_NEXT_MIDNIGHT: Final = datetime(2024, 1, 16)
+
+
+class TestClock:
+    """共享时钟缓存测试类"""
+
+    def setup_method(self) -> None:
+        _clock.reset_clock()
+
+    def test_now_cached_within_ttl(self) -> None:
+        """测试有效期内返回同一时间"""
+        with patch("cc_status.modules._clock._monotonic", side_effect=[100.0, 100.05]):
+            first = _clock.now_cached()
+            second = _clock.now_cached()
+
+        assert first is second
+
+    def test_now_cached_expired(self) -> None:
+        """测试过期后重新获取时间"""
+        with patch("cc_status.modules._clock._monotonic", side_effect=[100.0, 100.5]):
+            first = _clock.now_cached()
+            second = _clock.now_cached()
+
+        assert first is not second
+
+
+class TestResetTimerModule:
+    """重置倒计时模块测试类"""
+
+    def setup_method(self) -> None:
+        _clock.reset_clock()
+
+    def test_metadata(self) -> None:
+        """测试模块元数据"""
+        assert ResetTimerModule().metadata.name == "reset_timer"
+
+    def test_no_context(self) -> None:
+        """测试未设置上下文时禁用"""
+        module = ResetTimerModule()
+
+        assert module.is_available() is False
+        assert module.get_output().status == ModuleStatus.DISABLED
+
+    def test_reset_timestamp(self, frozen_now: datetime) -> None:
+        """测试从时间戳获取重置时间"""
+        module = ResetTimerModule()
+        module.set_context({"cost": {"next_reset_time": frozen_now.timestamp() + 3 * 3600}})
+
+        output = module.get_output()
+
+        assert output.color == "green"
+        assert output.text == "3h 0m"
+
+    def test_default_midnight(self, frozen_now: datetime) -> None:
+        """测试默认重置时间为次日午夜"""
+        module = ResetTimerModule()
+        module.set_context({})
+
+        assert module._reset_time == _NEXT_MIDNIGHT
+
+    def test_next_midnight_cached_per_day(self, frozen_now: datetime) -> None:
+        """测试次日午夜按日期缓存"""
+        first = _next_midnight(frozen_now)
+        same_day = _next_midnight(datetime(2024, 1, 15, 23, 59))
+        next_day = _next_midnight(_NEXT_MIDNIGHT + timedelta(minutes=1))
+
+        assert first is same_day
+        assert first == _NEXT_MIDNIGHT
+        assert next_day == datetime(2024, 1, 17)
+
+    def test_format_seconds(self) -> None:
+        """测试秒数格式化"""
+        module = ResetTimerModule()
+
+        assert module._format_seconds(7500) == "2h 5m"
+        assert module._format_seconds(187) == "3m 7s"
+        assert module._format_seconds(42) == "42s"
+
+    def test_calculate_remaining_uses_timestamp(self) -> None:
+        """测试剩余秒数基于时间戳计算"""
+        module = ResetTimerModule()
+        module.set_context({"cost": {"next_reset_time": 1_000_000.0}})
+
+        with patch("cc_status.modules.time_modules._current_timestamp", return_value=996_400.0):
+            assert module._calculate_remaining() == 3600.0
+            assert module.get_output().text == "1h 0m"
+        with patch("cc_status.modules.time_modules._current_timestamp", return_value=1_000_100.0):
+            assert module._calculate_remaining() == 0.0
+
+    def test_near_reset_warning(self, frozen_now: datetime) -> None:
+        """测试临近重置时告警"""
+        module = ResetTimerModule()
+        module.set_context({"cost": {"next_reset_time": frozen_now.timestamp() + 120}})
+
+        output = module.get_output()
+
+        assert output.text == "2m 0s"
+        assert output.color == "red"
+        assert output.status == ModuleStatus.WARNING